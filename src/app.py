@@ -1470,6 +1470,8 @@ class LocalTaggerApp(QMainWindow):
                 event.ignore()
                 return
         
+        # The SAM worker thread stays alive waiting for tasks - stop it
+        self._sam_worker.stop()
         event.accept()
     
     def keyPressEvent(self, event):
@@ -1498,16 +1500,21 @@ class LocalTaggerApp(QMainWindow):
         
         # Create worker
         self._sam_worker = SAMWorker(self)
+        self._sam_provider = "CPU"
         self._sam_worker.set_model_paths(str(encoder_path), str(decoder_path))
         
         # Connect signals
         self._sam_worker.model_loaded.connect(self._on_sam_model_loaded)
+        self._sam_worker.device_selected.connect(self._on_sam_device_selected)
         self._sam_worker.model_load_failed.connect(self._on_sam_model_failed)
         self._sam_worker.encoding_started.connect(self._on_sam_encoding_started)
         self._sam_worker.encoding_finished.connect(self._on_sam_encoding_finished)
-        self._sam_worker.mask_ready.connect(self._on_sam_mask_ready)
+        self._sam_worker.shape_ready.connect(self._on_sam_shape_ready)
         self._sam_worker.error_occurred.connect(self._on_sam_error)
         
+        # Start the worker thread once: it waits for requests until closeEvent stops it
+        self._sam_worker.start()
+        
         # Load models (async)
         self.main_window.set_sam_ready(False)
         self._sam_worker.request_load_models()
@@ -1548,7 +1555,15 @@ class LocalTaggerApp(QMainWindow):
     def _on_sam_model_loaded(self):
         """When SAM model loaded."""
         self.main_window.set_sam_ready(True)
-        self.statusbar.showMessage(self.tr("✓ SAM model loaded - Press T to enable AI"))
+        # Provider name is appended outside tr() so the existing translation still applies
+        self.statusbar.showMessage(
+            self.tr("✓ SAM model loaded - Press T to enable AI") + f" [{self._sam_provider}]"
+        )
+    
+    def _on_sam_device_selected(self, provider: str):
+        """Execution provider chosen for SAM (CUDA, DirectML, CoreML or CPU)."""
+        # Emitted before model_loaded, which shows it in the status bar
+        self._sam_provider = provider.removesuffix("ExecutionProvider")
     
     def _on_sam_model_failed(self, error: str):
         """SAM model load error."""
@@ -1601,10 +1616,8 @@ class LocalTaggerApp(QMainWindow):
         self.statusbar.showMessage(f"🔍 AI {mode_text} segmentation in progress...")
         self._sam_worker.request_infer_box(x1, y1, x2, y2, mode)
     
-    def _on_sam_mask_ready(self, mask, mode: str, x: int, y: int):
-        """When SAM mask is ready."""
-        import numpy as np
-        
+    def _on_sam_shape_ready(self, shape, mode: str, x: int, y: int):
+        """When SAM result is ready (bbox or polygon points, extracted by the worker)."""
         image_path = self.main_window.get_current_image_path()
         if not image_path:
             return
@@ -1615,7 +1628,7 @@ class LocalTaggerApp(QMainWindow):
         
         if mode == "bbox":
             # Mask → BBox
-            result = self._sam_worker.get_bbox_from_mask(mask)
+            result = shape
             if result is None:
                 self.statusbar.showMessage("❌ Object not found")
                 return
@@ -1628,7 +1641,7 @@ class LocalTaggerApp(QMainWindow):
             
         elif mode == "polygon":
             # Mask → Polygon
-            points = self._sam_worker.get_polygon_from_mask(mask)
+            points = shape
             if points is None or len(points) < 3:
                 self.statusbar.showMessage("❌ Object not found")
                 return
@@ -1699,7 +1712,7 @@ class LocalTaggerApp(QMainWindow):
         
         # Read image
         try:
-            img_data = np.frombuffer(open(image_path, 'rb').read(), np.uint8)
+            img_data = np.fromfile(image_path, dtype=np.uint8)  # Unicode-safe, file closed
             image = cv2.imdecode(img_data, cv2.IMREAD_COLOR)
             if image is None:
                 return
@@ -1707,6 +1720,6 @@ class LocalTaggerApp(QMainWindow):
             self.statusbar.showMessage(self.tr("❌ Could not read image: {}").format(e))
             return
         
-        # Start encoding
-        self._sam_worker.request_encode_image(image)
+        # Start encoding (the decoded image is only used by the worker: no copy)
+        self._sam_worker.request_encode_image(image, take_ownership=True)
 
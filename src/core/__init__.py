@@ -10,7 +10,7 @@ from .annotation_manager import AnnotationManager
 from .annotation import BoundingBox, Polygon, AnnotationType, ImageAnnotations
 from .exporter import (
     BaseExporter, YOLOExporter, COCOExporter, 
-    CustomTXTExporter, CustomJSONExporter
+    CustomTXTExporter, CustomJSONExporter, dumps_json
 )
 from .sam_inferencer import SAMInferencer
 from .sam_worker import SAMWorker
@@ -30,6 +30,7 @@ __all__ = [
     "COCOExporter",
     "CustomTXTExporter",
     "CustomJSONExporter",
+    "dumps_json",
     "SAMInferencer",
     "SAMWorker"
 ]
@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 from enum import Enum
 
+import numpy as np
+
 
 class AnnotationType(Enum):
     """Annotation type."""
@@ -73,10 +75,35 @@ class Polygon:
     """
     class_id: int
     points: List[Tuple[float, float]] = field(default_factory=list)  # [(x, y), ...]
+    # (points, point_count, bounds) - see bounds
+    _bounds_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def add_point(self, x: float, y: float, img_width: int, img_height: int):
         """Adds a normalized point."""
         self.points.append((x / img_width, y / img_height))
+    
+    @property
+    def is_valid(self) -> bool:
+        """True if the polygon has enough points to be exported (3+)."""
+        return len(self.points) >= 3
+    
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """
+        Normalized bounding box (x_min, y_min, x_max, y_max) of the points.
+        
+        Memoized; recomputed when points is reassigned or points are added.
+        Edit points by assigning a new list (not by replacing items in place).
+        """
+        points = self.points
+        cache = self._bounds_cache
+        if cache is not None and cache[0] is points and cache[1] == len(points):
+            return cache[2]
+        
+        xs, ys = zip(*points)
+        bounds = (min(xs), min(ys), max(xs), max(ys))
+        self._bounds_cache = (points, len(points), bounds)
+        return bounds
         
     def to_pixel_points(self, img_width: int, img_height: int) -> List[Tuple[int, int]]:
         """Converts to pixel coordinates."""
@@ -94,3 +121,19 @@ class ImageAnnotations:
     image_height: int
     bboxes: List[BoundingBox] = field(default_factory=list)
     polygons: List[Polygon] = field(default_factory=list)
+    
+    def bbox_array(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns bboxes as parallel arrays (for vectorized consumers).
+        
+        Returns:
+            (class_ids int32[N], xywh float64[N, 4]) - normalized
+            (x_center, y_center, width, height) rows
+        """
+        count = len(self.bboxes)
+        class_ids = np.fromiter((b.class_id for b in self.bboxes), dtype=np.int32, count=count)
+        xywh = np.fromiter(
+            (v for b in self.bboxes for v in (b.x_center, b.y_center, b.width, b.height)),
+            dtype=np.float64, count=count * 4
+        ).reshape(count, 4)
+        return class_ids, xywh
@@ -259,17 +259,21 @@ class AnnotationManager:
         image_name = Path(image_path).stem
         txt_path = output_dir / f"{image_name}.txt"
         
-        lines = []
-        
-        # Write BBoxes
-        for bbox in annotations.bboxes:
-            lines.append(bbox.to_yolo_format())
+        # Write BBoxes (one %-format per line)
+        lines = [
+            "%d %.6f %.6f %.6f %.6f" % (
+                bbox.class_id, bbox.x_center, bbox.y_center, bbox.width, bbox.height
+            )
+            for bbox in annotations.bboxes
+        ]
             
         # Write Polygons (YOLO segmentation format)
         for polygon in annotations.polygons:
-            if len(polygon.points) >= 3:
-                points_str = " ".join(f"{x:.6f} {y:.6f}" for x, y in polygon.points)
-                lines.append(f"{polygon.class_id} {points_str}")
+            if polygon.is_valid:
+                points = polygon.points
+                lines.append(("%d" + " %.6f %.6f" * len(points)) % (
+                    polygon.class_id, *[c for point in points for c in point]
+                ))
         
         # Write file
         with open(txt_path, "w", encoding="utf-8") as f:
@@ -8,7 +8,7 @@ OpenCV based augmentation support.
 import cv2
 import numpy as np
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Tuple, Optional, Dict, Any
 from enum import Enum
 from pathlib import Path
@@ -32,6 +32,18 @@ class ResizeConfig:
     mode: ResizeMode = ResizeMode.STRETCH
 
 
+@dataclass(frozen=True, slots=True)
+class ResizeInfo:
+    """Geometry of a performed resize (built once per image, read per label)."""
+    mode: Optional[str] = None  # "stretch", "fit_<border>" or None (no resize)
+    scale: float = 1.0
+    scale_x: float = 1.0
+    scale_y: float = 1.0
+    offset_x: int = 0
+    offset_y: int = 0
+    new_size: Optional[Tuple[int, int]] = None  # Inner (unpadded) size for fit_* modes
+
+
 @dataclass
 class AugmentationConfig:
     """Augmentation configuration - Roboflow style."""
@@ -116,9 +128,9 @@ class Augmentor:
         self, 
         image: np.ndarray, 
         config: ResizeConfig
-    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+    ) -> Tuple[np.ndarray, ResizeInfo]:
         if not config.enabled:
-            return image, {"scale": 1.0, "offset": (0, 0), "mode": None}
+            return image, ResizeInfo()
         
         h, w = image.shape[:2]
         target_w, target_h = config.width, config.height
@@ -134,16 +146,16 @@ class Augmentor:
         elif config.mode == ResizeMode.FIT_WHITE:
             return self._resize_fit(image, target_w, target_h, border_mode="white")
         
-        return image, {"scale": 1.0, "offset": (0, 0), "mode": None}
+        return image, ResizeInfo()
     
-    def _resize_stretch(self, image: np.ndarray, target_w: int, target_h: int) -> Tuple[np.ndarray, Dict]:
+    def _resize_stretch(self, image: np.ndarray, target_w: int, target_h: int) -> Tuple[np.ndarray, ResizeInfo]:
         h, w = image.shape[:2]
         resized = cv2.resize(image, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
-        return resized, {"mode": "stretch", "scale_x": target_w / w, "scale_y": target_h / h, "offset": (0, 0)}
+        return resized, ResizeInfo(mode="stretch", scale_x=target_w / w, scale_y=target_h / h)
     
 
     
-    def _resize_fit(self, image: np.ndarray, target_w: int, target_h: int, border_mode: str) -> Tuple[np.ndarray, Dict]:
+    def _resize_fit(self, image: np.ndarray, target_w: int, target_h: int, border_mode: str) -> Tuple[np.ndarray, ResizeInfo]:
         h, w = image.shape[:2]
         scale = min(target_w / w, target_h / h)
         new_w, new_h = int(w * scale), int(h * scale)
@@ -157,7 +169,10 @@ class Augmentor:
         else:
             result = cv2.copyMakeBorder(resized, pad_y, target_h - new_h - pad_y, pad_x, target_w - new_w - pad_x, cv2.BORDER_CONSTANT, value=(0, 0, 0))
         
-        return result, {"mode": f"fit_{border_mode}", "scale": scale, "offset": (pad_x, pad_y), "new_size": (new_w, new_h)}
+        return result, ResizeInfo(
+            mode=f"fit_{border_mode}", scale=scale,
+            offset_x=pad_x, offset_y=pad_y, new_size=(new_w, new_h)
+        )
     
     # ─────────────────────────────────────────────────────────────────
     # Augmentation Operations
@@ -335,44 +350,7 @@ class Augmentor:
         results.append((image, {"original": True, "aug_index": 0}))
         
         # 2. Create augmented copies (multiplier - 1 count)
-        export_config = AugmentationConfig(
-            enabled=config.enabled,
-            multiplier=config.multiplier,
-            brighten_enabled=config.brighten_enabled,
-            darken_enabled=config.darken_enabled,
-            brightness_value=config.brightness_value,
-            contrast_enabled=config.contrast_enabled,
-            contrast_value=config.contrast_value,
-            rotation_enabled=config.rotation_enabled,
-            rotation_value=config.rotation_value,
-            h_flip_enabled=config.h_flip_enabled,
-            h_flip_percent=config.h_flip_percent,
-            v_flip_enabled=config.v_flip_enabled,
-            v_flip_percent=config.v_flip_percent,
-            blur_enabled=config.blur_enabled,
-            blur_value=config.blur_value,
-            noise_enabled=config.noise_enabled,
-            noise_value=config.noise_value,
-            hue_enabled=config.hue_enabled,
-            hue_value=config.hue_value,
-            saturation_enabled=config.saturation_enabled,
-            saturation_value=config.saturation_value,
-            grayscale_enabled=config.grayscale_enabled,
-            grayscale_percent=config.grayscale_percent,
-            exposure_enabled=config.exposure_enabled,
-            exposure_value=config.exposure_value,
-            cutout_enabled=config.cutout_enabled,
-            cutout_size=config.cutout_size,
-            cutout_count=config.cutout_count,
-            cutout_apply_percent=config.cutout_apply_percent,
-            motion_blur_enabled=config.motion_blur_enabled,
-            motion_blur_value=config.motion_blur_value,
-            shear_enabled=config.shear_enabled,
-            shear_horizontal=config.shear_horizontal,
-            shear_vertical=config.shear_vertical,
-            resize=config.resize,
-            preview_mode=False
-        )
+        export_config = replace(config, preview_mode=False)
         
         for i in range(1, config.multiplier):  # Start from 1 (0 is original)
             aug_image, transform = self.apply_augmentation(image, export_config)
@@ -391,44 +369,7 @@ class Augmentor:
             return image
         
         # Preview mode enabled - percentage control skipped in preview
-        preview_config = AugmentationConfig(
-            enabled=config.enabled,
-            multiplier=config.multiplier,
-            brighten_enabled=config.brighten_enabled,
-            darken_enabled=config.darken_enabled,
-            brightness_value=config.brightness_value,
-            contrast_enabled=config.contrast_enabled,
-            contrast_value=config.contrast_value,
-            rotation_enabled=config.rotation_enabled,
-            rotation_value=config.rotation_value,
-            h_flip_enabled=config.h_flip_enabled,
-            h_flip_percent=config.h_flip_percent,
-            v_flip_enabled=config.v_flip_enabled,
-            v_flip_percent=config.v_flip_percent,
-            blur_enabled=config.blur_enabled,
-            blur_value=config.blur_value,
-            noise_enabled=config.noise_enabled,
-            noise_value=config.noise_value,
-            hue_enabled=config.hue_enabled,
-            hue_value=config.hue_value,
-            saturation_enabled=config.saturation_enabled,
-            saturation_value=config.saturation_value,
-            grayscale_enabled=config.grayscale_enabled,
-            grayscale_percent=config.grayscale_percent,
-            exposure_enabled=config.exposure_enabled,
-            exposure_value=config.exposure_value,
-            cutout_enabled=config.cutout_enabled,
-            cutout_size=config.cutout_size,
-            cutout_count=config.cutout_count,
-            cutout_apply_percent=config.cutout_apply_percent,
-            motion_blur_enabled=config.motion_blur_enabled,
-            motion_blur_value=config.motion_blur_value,
-            shear_enabled=config.shear_enabled,
-            shear_horizontal=config.shear_horizontal,
-            shear_vertical=config.shear_vertical,
-            resize=config.resize,
-            preview_mode=True
-        )
+        preview_config = replace(config, preview_mode=True)
         
         aug_image, _ = self.apply_augmentation(image, preview_config)
         return aug_image
@@ -619,10 +560,10 @@ class Augmentor:
             )
         
         # Keep coordinates within [0, 1]
-        x_center = max(0, min(1, x_center))
-        y_center = max(0, min(1, y_center))
-        w = max(0.001, min(1, w))
-        h = max(0.001, min(1, h))
+        x_center = 0.0 if x_center < 0 else 1.0 if x_center > 1 else x_center
+        y_center = 0.0 if y_center < 0 else 1.0 if y_center > 1 else y_center
+        w = 0.001 if w < 0.001 else 1.0 if w > 1 else w
+        h = 0.001 if h < 0.001 else 1.0 if h > 1 else h
         
         return (x_center, y_center, w, h)
     
@@ -767,10 +708,10 @@ class Augmentor:
         max_y = max_y / scale_y
         
         # 7. Clipping
-        min_x = np.clip(min_x, 0, img_w)
-        max_x = np.clip(max_x, 0, img_w)
-        min_y = np.clip(min_y, 0, img_h)
-        max_y = np.clip(max_y, 0, img_h)
+        min_x = 0 if min_x < 0 else img_w if min_x > img_w else min_x
+        max_x = 0 if max_x < 0 else img_w if max_x > img_w else max_x
+        min_y = 0 if min_y < 0 else img_h if min_y > img_h else min_y
+        max_y = 0 if max_y < 0 else img_h if max_y > img_h else max_y
         
         # 8. Calculate new dimensions
         new_w_px = max_x - min_x
@@ -796,8 +737,9 @@ class Augmentor:
         points: List[Tuple[float, float]],
         transform: Dict[str, Any],
         img_w: int,
-        img_h: int
-    ) -> List[Tuple[float, float]]:
+        img_h: int,
+        as_array: bool = False
+    ) -> List[Tuple[float, float]] | np.ndarray:
         """Transform polygon points according to transform.
         
         Transformation order must be SAME as apply_augmentation:
@@ -805,99 +747,162 @@ class Augmentor:
         2. H_flip
         3. V_flip
         4. Rotation
+        
+        With as_array=True the transformed (N, 2) float64 array is returned
+        as-is, so array consumers skip the list-of-tuples conversion.
         """
-        import math
-        import numpy as np
+        pts = np.array(points, dtype=np.float64).reshape(-1, 2)
+        if self._is_identity_transform(transform):
+            # Nothing geometric to apply (e.g. the original image): same [0, 1] clip only
+            np.clip(pts, 0.0, 1.0, out=pts)
+        else:
+            self._transform_points(pts, transform, img_w, img_h)
+        if as_array:
+            return pts
+        return [(x, y) for x, y in pts.tolist()]
+    
+    def transform_polygons(
+        self,
+        polygons: List[List[Tuple[float, float]]],
+        transform: Dict[str, Any],
+        img_w: int,
+        img_h: int
+    ) -> List[List[Tuple[float, float]]]:
+        """Transform all polygons of an image in a single pass.
         
+        Points of every polygon are concatenated into one array, transformed
+        once and split back into per-polygon lists (same order as input).
+        """
+        if not polygons:
+            return []
+        
+        lengths = [len(points) for points in polygons]
+        pts = np.array(
+            [p for points in polygons for p in points], dtype=np.float64
+        ).reshape(-1, 2)
+        if self._is_identity_transform(transform):
+            np.clip(pts, 0.0, 1.0, out=pts)  # Same clip as _transform_points
+        else:
+            self._transform_points(pts, transform, img_w, img_h)
+        
+        flat = pts.tolist()
         result = []
-        for x, y in points:
-            # 1. Shear transformation
-            shear = transform.get("shear")
-            if shear:
-                px, py = x * img_w, y * img_h
-                
-                shear_h_rad = np.tan(np.radians(shear.get("h", 0)))
-                shear_v_rad = np.tan(np.radians(shear.get("v", 0)))
-                
-                # Flip for negative shear
-                h_flip_shear = shear_h_rad < 0
-                v_flip_shear = shear_v_rad < 0
-                
-                if h_flip_shear:
-                    px = img_w - px
-                if v_flip_shear:
-                    py = img_h - py
-                
-                abs_shear_h = abs(shear_h_rad)
-                abs_shear_v = abs(shear_v_rad)
-                
-                # Apply shear formula
-                new_px = px + abs_shear_h * py
-                new_py = py + abs_shear_v * px
-                
-                # Scale factor (resize effect after expansion)
-                nW = img_w + abs_shear_h * img_h
-                nH = img_h + abs_shear_v * img_w
-                
-                new_px = new_px / (nW / img_w)
-                new_py = new_py / (nH / img_h)
-                
-                # Revert flip
-                if h_flip_shear:
-                    new_px = img_w - new_px
-                if v_flip_shear:
-                    new_py = img_h - new_py
-                
-                x = new_px / img_w
-                y = new_py / img_h
+        start = 0
+        for length in lengths:
+            result.append([(x, y) for x, y in flat[start:start + length]])
+            start += length
+        return result
+    
+    @staticmethod
+    def _is_identity_transform(transform: Dict[str, Any]) -> bool:
+        """True if transform has no geometric effect on coordinates."""
+        rotation = transform.get("rotation")
+        return not (
+            transform.get("shear")
+            or transform.get("h_flip")
+            or transform.get("v_flip")
+            or (rotation and abs(rotation) > 0.5)
+        )
+    
+    def _transform_points(
+        self,
+        pts: np.ndarray,
+        transform: Dict[str, Any],
+        img_w: int,
+        img_h: int
+    ) -> np.ndarray:
+        """
+        Transform an (N, 2) array of normalized points in place.
+        
+        Vectorized kernel behind transform_polygon: the transform parameters
+        are resolved once and applied to all points with array arithmetic.
+        """
+        import math
+        
+        x = pts[:, 0]
+        y = pts[:, 1]
+        
+        # 1. Shear transformation
+        shear = transform.get("shear")
+        if shear:
+            px, py = x * img_w, y * img_h
             
-            # 2. Flip transformations
-            if transform.get("h_flip"):
-                x = 1.0 - x
-            if transform.get("v_flip"):
-                y = 1.0 - y
+            shear_h_rad = math.tan(math.radians(shear.get("h", 0)))
+            shear_v_rad = math.tan(math.radians(shear.get("v", 0)))
             
-            # 3. Rotation transformation
-            rotation = transform.get("rotation")
-            if rotation and abs(rotation) > 0.5:
-                # Convert to pixel
-                px, py = x * img_w, y * img_h
-                center_x, center_y = img_w / 2, img_h / 2
-                rad = math.radians(-rotation)
-                cos_a, sin_a = math.cos(rad), math.sin(rad)
-                
-                new_px = (px - center_x) * cos_a - (py - center_y) * sin_a + center_x
-                new_py = (px - center_x) * sin_a + (py - center_y) * cos_a + center_y
-                
-                x = new_px / img_w
-                y = new_py / img_h
+            # Flip for negative shear
+            h_flip_shear = shear_h_rad < 0
+            v_flip_shear = shear_v_rad < 0
             
-            # Keep coordinates within [0, 1]
-            x = max(0, min(1, x))
-            y = max(0, min(1, y))
+            if h_flip_shear:
+                px = img_w - px
+            if v_flip_shear:
+                py = img_h - py
             
-            result.append((x, y))
-        return result
+            abs_shear_h = abs(shear_h_rad)
+            abs_shear_v = abs(shear_v_rad)
+            
+            # Scale factor (resize effect after expansion)
+            nW = img_w + abs_shear_h * img_h
+            nH = img_h + abs_shear_v * img_w
+            
+            # Apply shear formula
+            new_px = (px + abs_shear_h * py) * (img_w / nW)
+            new_py = (py + abs_shear_v * px) * (img_h / nH)
+            
+            # Revert flip
+            if h_flip_shear:
+                new_px = img_w - new_px
+            if v_flip_shear:
+                new_py = img_h - new_py
+            
+            x[:] = new_px / img_w
+            y[:] = new_py / img_h
+        
+        # 2. Flip transformations
+        if transform.get("h_flip"):
+            np.subtract(1.0, x, out=x)
+        if transform.get("v_flip"):
+            np.subtract(1.0, y, out=y)
+        
+        # 3. Rotation transformation
+        rotation = transform.get("rotation")
+        if rotation and abs(rotation) > 0.5:
+            # Convert to pixel (relative to image center)
+            center_x, center_y = img_w / 2, img_h / 2
+            dx = x * img_w - center_x
+            dy = y * img_h - center_y
+            rad = math.radians(-rotation)
+            cos_a, sin_a = math.cos(rad), math.sin(rad)
+            
+            x[:] = (dx * cos_a - dy * sin_a + center_x) / img_w
+            y[:] = (dx * sin_a + dy * cos_a + center_y) / img_h
+        
+        # Keep coordinates within [0, 1]
+        np.clip(pts, 0.0, 1.0, out=pts)
+        return pts
     
     def transform_bbox_for_resize(
         self,
         bbox: Tuple[float, float, float, float],
-        resize_info: Dict[str, Any],
+        resize_info: ResizeInfo,
         orig_w: int,
         orig_h: int,
         new_w: int,
         new_h: int
     ) -> Tuple[float, float, float, float]:
         x_center, y_center, w, h = bbox
-        mode = resize_info.get("mode")
+        mode = resize_info.mode
         
         if mode == "stretch":
             return bbox
         elif mode and mode.startswith("fit_"):
-            scale = resize_info.get("scale", 1.0)
-            offset = resize_info.get("offset", (0, 0))
-            px = x_center * orig_w * scale + offset[0]
-            py = y_center * orig_h * scale + offset[1]
+            scale = resize_info.scale
+            offset_x, offset_y = resize_info.offset_x, resize_info.offset_y
+            if scale == 1.0 and offset_x == 0 and offset_y == 0 and orig_w == new_w and orig_h == new_h:
+                return bbox  # Image already had the target size
+            px = x_center * orig_w * scale + offset_x
+            py = y_center * orig_h * scale + offset_y
             pw = w * orig_w * scale
             ph = h * orig_h * scale
             return (px / new_w, py / new_h, pw / new_w, ph / new_h)
@@ -1065,7 +1070,7 @@ class Augmentor:
     def get_resize_duplicates_bbox(
         self,
         bbox: Tuple[float, float, float, float],
-        resize_info: Dict[str, Any],
+        resize_info: ResizeInfo,
         orig_w: int,
         orig_h: int,
         new_w: int,
@@ -1078,15 +1083,15 @@ class Augmentor:
         # Calculate main (center) bbox first
         main_bbox = self.transform_bbox_for_resize(bbox, resize_info, orig_w, orig_h, new_w, new_h)
         
-        mode = resize_info.get("mode")
+        mode = resize_info.mode
         if mode != "fit_reflect":
             return [main_bbox]
         
         results = [main_bbox]
         
         # Get padding and inner size info
-        pad_x, pad_y = resize_info.get("offset", (0, 0))
-        inner_w, inner_h = resize_info.get("new_size", (new_w, new_h))
+        pad_x, pad_y = resize_info.offset_x, resize_info.offset_y
+        inner_w, inner_h = resize_info.new_size or (new_w, new_h)
         
         # BBox pixel coordinates (on target image)
         mx_c, my_c, mw, mh = main_bbox
@@ -1158,7 +1163,7 @@ class Augmentor:
     def get_resize_duplicates_polygon(
         self,
         points: List[Tuple[float, float]],
-        resize_info: Dict[str, Any],
+        resize_info: ResizeInfo,
         orig_w: int,
         orig_h: int,
         new_w: int,
@@ -1170,28 +1175,22 @@ class Augmentor:
         # Calculate main (center) polygon first
         # No transform_polygon_for_resize method, apply manually:
         
-        main_poly = []
-        mode = resize_info.get("mode")
-        scale = resize_info.get("scale", 1.0)
-        offset = resize_info.get("offset", (0, 0))
-        inner_w, inner_h = resize_info.get("new_size", (new_w, new_h))
-        pad_x, pad_y = offset
+        mode = resize_info.mode
+        scale = resize_info.scale
+        pad_x, pad_y = resize_info.offset_x, resize_info.offset_y
+        inner_w, inner_h = resize_info.new_size or (new_w, new_h)
+        
+        # Main polygon transformation (points may be a list or an (N, 2) array)
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
         
-        # Main polygon transformation
-        for px, py in points:
-            # First pixel (on final image)
-            if mode and mode.startswith("fit_"):
-                res_x = px * orig_w * scale + pad_x
-                res_y = py * orig_h * scale + pad_y
-            else: # stretch or none
-                res_x = px * new_w
-                res_y = py * new_h
-            
-            main_poly.append((res_x, res_y)) # Pixel coordinates for now
-            
         if mode != "fit_reflect":
-            # Convert to normal and return
-            return [[(x/new_w, y/new_h) for x, y in main_poly]]
+            # Only fit_* modes move points; stretch/none keep normalized coords
+            if mode and mode.startswith("fit_"):
+                pts = pts * [orig_w * scale / new_w, orig_h * scale / new_h] + [pad_x / new_w, pad_y / new_h]
+            return [[(x, y) for x, y in pts.tolist()]]
+        
+        # First pixel (on final image) - pixel coordinates for now
+        main_poly = (pts * [orig_w * scale, orig_h * scale] + [pad_x, pad_y]).tolist()
             
         # For Reflection
         poly_results = []
@@ -1260,8 +1259,8 @@ class Augmentor:
         clamped = []
         all_outside = True
         for x, y in points:
-            cx = max(x_min, min(x_max, x))
-            cy = max(y_min, min(y_max, y))
+            cx = x_min if x < x_min else x_max if x > x_max else x
+            cy = y_min if y < y_min else y_max if y > y_max else y
             clamped.append((cx, cy))
             if x_min <= x <= x_max and y_min <= y <= y_max:
                 all_outside = False
@@ -4,13 +4,14 @@ Class Management
 Manages annotation classes (add, remove, assign color).
 """
 
+import json
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 import random
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelClass:
     """Represents an annotation class."""
     id: int
@@ -56,20 +57,27 @@ class ClassManager:
     ]
     
     def __init__(self):
-        self._classes: List[LabelClass] = []
+        # Keyed by class ID; dict insertion order keeps the list order (YOLO indices)
+        self._classes: Dict[int, LabelClass] = {}
         self._next_id: int = 0
         self._color_index: int = 0
+        self._version: int = 0
         
     @property
     def classes(self) -> List[LabelClass]:
         """Returns all classes."""
-        return self._classes.copy()
+        return list(self._classes.values())
     
     @property
     def count(self) -> int:
         """Returns class count."""
         return len(self._classes)
     
+    @property
+    def version(self) -> int:
+        """Change counter, incremented on every modification (for caches of class data)."""
+        return self._version
+    
     def add_class(self, name: str, color: Optional[str] = None) -> LabelClass:
         """
         Adds a new class.
@@ -91,8 +99,9 @@ class ClassManager:
             color=color
         )
         
-        self._classes.append(label_class)
+        self._classes[label_class.id] = label_class
         self._next_id += 1
+        self._version += 1
         
         return label_class
     
@@ -109,7 +118,7 @@ class ClassManager:
             Created LabelClass
         """
         # If ID already exists, return current
-        existing = self.get_by_id(class_id)
+        existing = self._classes.get(class_id)
         if existing:
             return existing
         
@@ -123,7 +132,8 @@ class ClassManager:
             color=color
         )
         
-        self._classes.append(label_class)
+        self._classes[class_id] = label_class
+        self._version += 1
         
         # Update _next_id (must be larger than max ID)
         if class_id >= self._next_id:
@@ -138,11 +148,10 @@ class ClassManager:
         Returns:
             True if deletion successful
         """
-        for i, cls in enumerate(self._classes):
-            if cls.id == class_id:
-                self._classes.pop(i)
-                return True
-        return False
+        if self._classes.pop(class_id, None) is None:
+            return False
+        self._version += 1
+        return True
     
     def update_class(self, class_id: int, name: Optional[str] = None, 
                      color: Optional[str] = None) -> bool:
@@ -160,27 +169,25 @@ class ClassManager:
             label_class.name = name
         if color is not None:
             label_class.color = color
+        self._version += 1
             
         return True
     
     def get_by_id(self, class_id: int) -> Optional[LabelClass]:
         """Returns class by ID."""
-        for cls in self._classes:
-            if cls.id == class_id:
-                return cls
-        return None
+        return self._classes.get(class_id)
     
     def get_by_name(self, name: str) -> Optional[LabelClass]:
         """Returns class by name."""
-        for cls in self._classes:
+        for cls in self._classes.values():
             if cls.name == name:
                 return cls
         return None
     
     def get_index(self, class_id: int) -> int:
         """Returns the index of the class in the list (for YOLO export)."""
-        for i, cls in enumerate(self._classes):
-            if cls.id == class_id:
+        for i, cls_id in enumerate(self._classes):
+            if cls_id == class_id:
                 return i
         return -1
     
@@ -210,19 +217,17 @@ class ClassManager:
         file_path = Path(file_path)
         
         # Only names (YOLO compatible classes.txt)
-        with open(file_path, "w", encoding="utf-8") as f:
-            for cls in self._classes:
-                f.write(f"{cls.name}\n")
+        # Build the whole file and write it in one call
+        content = "".join(f"{cls.name}\n" for cls in self._classes.values())
+        file_path.write_text(content, encoding="utf-8")
                 
         # Save color info in separate file
         meta_path = file_path.with_suffix(".json")
-        import json
         meta = {
-            "classes": [cls.to_dict() for cls in self._classes],
+            "classes": [cls.to_dict() for cls in self._classes.values()],
             "next_id": self._next_id
         }
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(meta, f, indent=2, ensure_ascii=False)
+        meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
     
     def load_from_file(self, file_path: Path | str):
         """
@@ -236,16 +241,15 @@ class ClassManager:
             
         self._classes.clear()
         self._color_index = 0
+        self._version += 1
         
         # Try JSON metadata first
         meta_path = file_path.with_suffix(".json")
         if meta_path.exists():
-            import json
             try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                for cls_data in meta.get("classes", []):
-                    self._classes.append(LabelClass.from_dict(cls_data))
+                meta = json.loads(meta_path.read_bytes())
+                loaded = [LabelClass.from_dict(cls_data) for cls_data in meta.get("classes", [])]
+                self._classes = {cls.id: cls for cls in loaded}
                 self._next_id = meta.get("next_id", len(self._classes))
                 # Update color index based on class count (new classes get different colors)
                 self._color_index = len(self._classes)
@@ -254,14 +258,15 @@ class ClassManager:
                 pass  # JSON broken, load from txt
         
         # Load from classes.txt only
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                name = line.strip()
-                if name:
-                    self.add_class(name)
+        names = file_path.read_text(encoding="utf-8").splitlines()
+        for name in names:
+            name = name.strip()
+            if name:
+                self.add_class(name)
     
     def clear(self):
         """Clears all classes."""
         self._classes.clear()
         self._next_id = 0
         self._color_index = 0
+        self._version += 1
@@ -5,12 +5,13 @@ Splits dataset into train/validation/test sets.
 """
 
 import random
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class SplitConfig:
     """Dataset split configuration."""
     enabled: bool = False
@@ -21,6 +22,26 @@ class SplitConfig:
     seed: int = 42
 
 
+@lru_cache(maxsize=64)
+def _compute_counts(
+    total: int,
+    train_ratio: float,
+    val_ratio: float,
+    test_ratio: float
+) -> Tuple[int, int, int]:
+    """Return (train, val, test) counts; ratios are normalized if they don't sum to 1.0."""
+    total_ratio = train_ratio + val_ratio + test_ratio
+    if abs(total_ratio - 1.0) > 0.01:
+        # Normalize
+        train_ratio /= total_ratio
+        val_ratio /= total_ratio
+    
+    train_count = int(total * train_ratio)
+    val_count = int(total * val_ratio)
+    # test_count = kalan
+    return train_count, val_count, total - train_count - val_count
+
+
 class DatasetSplitter:
     """
     Splits dataset into train/validation/test sets.
@@ -55,28 +76,24 @@ class DatasetSplitter:
         if not config.enabled:
             return {'all': list(image_files)}
         
-        # Validate ratios
-        total_ratio = config.train_ratio + config.val_ratio + config.test_ratio
-        if abs(total_ratio - 1.0) > 0.01:
-            # Normalize
-            config.train_ratio /= total_ratio
-            config.val_ratio /= total_ratio
-            config.test_ratio /= total_ratio
-        
-        # Copy and shuffle
-        files = list(image_files)
-        if config.shuffle:
-            random.seed(config.seed if config.seed else self.seed)
-            random.shuffle(files)
-        
+        files = image_files if isinstance(image_files, list) else list(image_files)
         total = len(files)
-        train_count = int(total * config.train_ratio)
-        val_count = int(total * config.val_ratio)
-        # test_count = kalan
+        train_count, val_count, _ = _compute_counts(
+            total, config.train_ratio, config.val_ratio, config.test_ratio
+        )
         
-        train_files = files[:train_count]
-        val_files = files[train_count:train_count + val_count]
-        test_files = files[train_count + val_count:]
+        if config.shuffle:
+            # Shuffle indices instead of the Path list (local RNG: don't touch the
+            # global random state); same order random.shuffle(files) would give
+            order = list(range(total))
+            random.Random(config.seed if config.seed else self.seed).shuffle(order)
+            train_files = [files[i] for i in order[:train_count]]
+            val_files = [files[i] for i in order[train_count:train_count + val_count]]
+            test_files = [files[i] for i in order[train_count + val_count:]]
+        else:
+            train_files = files[:train_count]
+            val_files = files[train_count:train_count + val_count]
+            test_files = files[train_count + val_count:]
         
         result = {}
         if train_files:
@@ -102,9 +119,9 @@ class DatasetSplitter:
         if not config.enabled:
             return {'all': total_count}
         
-        train_count = int(total_count * config.train_ratio)
-        val_count = int(total_count * config.val_ratio)
-        test_count = total_count - train_count - val_count
+        train_count, val_count, test_count = _compute_counts(
+            total_count, config.train_ratio, config.val_ratio, config.test_ratio
+        )
         
         return {
             'train': train_count,
@@ -5,31 +5,165 @@ Annotation export operations in various formats.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 import json
+import os
+import re
+import shutil
+import string
+import sys
+import tempfile
+import threading
 import datetime
+import itertools
+
+import numpy as np
+
+try:
+    import orjson  # Optional: C serializer, much faster for large exports
+except ImportError:
+    orjson = None
 
 from .annotation import BoundingBox, Polygon, ImageAnnotations
 from .class_manager import ClassManager
 
 
+# Shared stand-in for unlabeled images (read-only)
+_EMPTY_ANNOTATIONS = ImageAnnotations(image_path="", image_width=0, image_height=0)
+
+# Per-thread label file buffer, reused across images instead of reallocated
+_local = threading.local()
+
+
+def _label_buffer() -> bytearray:
+    """Return this thread's label file buffer, cleared."""
+    buf = getattr(_local, "buf", None)
+    if buf is None:
+        buf = _local.buf = bytearray()
+    else:
+        buf.clear()
+    return buf
+
+
+# YOLO bbox line: class_id x_center y_center width height
+_YOLO_BBOX_LINE = b"%d %.6f %.6f %.6f %.6f\n"
+
+
+@lru_cache(maxsize=256)
+def _yolo_polygon_line(point_count: int) -> bytes:
+    """YOLO polygon line pattern for point_count points: class_id x1 y1 x2 y2 ..."""
+    return b"%d" + b" %.6f %.6f" * point_count + b"\n"
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_json(data: Any, json_path: Path, pretty: bool = False):
+    """Write data as UTF-8 JSON, compact unless pretty (orjson if available, stdlib otherwise)."""
+    if not pretty:
+        payload = dumps_json(data)
+    elif orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    json_path.write_bytes(payload)
+
+
 class BaseExporter(ABC):
     """Base exporter class."""
     
     def __init__(self, class_manager: ClassManager):
         self.class_manager = class_manager
+        # Class data derived from class_manager, rebuilt when its version changes
+        self._class_names: Dict[int, str] = {}
+        self._classes_txt = b""
+        self._class_version = -1
         self.progress_callback: Optional[Callable[[int, int], None]] = None
+        self._last_reported = 0
     
     def set_progress_callback(self, callback: Callable[[int, int], None]):
         """Sets progress callback. callback(current, total)"""
         self.progress_callback = callback
     
     def _report_progress(self, current: int, total: int):
-        """Report progress."""
-        if self.progress_callback:
+        """
+        Report progress.
+        
+        Throttled to roughly every 1% (plus the final item) so GUI callbacks
+        don't dominate large exports.
+        """
+        if not self.progress_callback:
+            return
+        step = max(1, total // 100)
+        if current - self._last_reported >= step or current == total:
+            self._last_reported = current
             self.progress_callback(current, total)
     
+    def _refresh_class_cache(self):
+        """
+        Rebuild the class snapshot if the classes changed since the last export.
+        
+        _class_names: class ID -> name (insertion order, names interned)
+        _classes_txt: classes.txt content
+        """
+        version = self.class_manager.version
+        if version == self._class_version:
+            return
+        self._class_names = {cls.id: sys.intern(cls.name) for cls in self.class_manager.classes}
+        self._classes_txt = "\n".join(self._class_names.values()).encode("utf-8")
+        self._class_version = version
+    
+    @staticmethod
+    def _lookup_annotations(
+        annotations_dict: Dict[str, ImageAnnotations],
+        image_files: List[Path]
+    ) -> List[ImageAnnotations]:
+        """Resolve the annotations of every image in one pass (shared empty one if unlabeled)."""
+        get = annotations_dict.get
+        return [get(key, _EMPTY_ANNOTATIONS) for key in map(os.fspath, image_files)]
+    
+    def _run_per_image(
+        self,
+        export_image: Callable[[Path, ImageAnnotations, str], None],
+        annotations_dict: Dict[str, ImageAnnotations],
+        output_dir: Path,
+        image_files: List[Path]
+    ) -> int:
+        """
+        Run export_image for every image on a thread pool.
+        
+        Images are independent (one output file each), so formatting and file
+        writes overlap. Progress is reported from the calling thread.
+        export_image receives the image's annotations (empty if unlabeled) and
+        output_dir as a plain string path.
+        
+        Returns:
+            Count of exported files
+        """
+        total = len(image_files)
+        self._last_reported = 0  # New export run
+        out_dir = os.fspath(output_dir)
+        # Mostly small file writes (GIL released): oversubscribe the cores
+        max_workers = min((os.cpu_count() or 4) * 2, 32)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(export_image, image_path, annotations, out_dir)
+                for image_path, annotations in zip(
+                    image_files, self._lookup_annotations(annotations_dict, image_files)
+                )
+            ]
+            for i, future in enumerate(as_completed(futures)):
+                future.result()
+                self._report_progress(i + 1, total)
+        return total
+    
     @abstractmethod
     def export(
         self, 
@@ -62,11 +196,15 @@ class YOLOExporter(BaseExporter):
     
     BBox: class_id x_center y_center width height
     Polygon: class_id x1 y1 x2 y2 x3 y3 ...
+    
+    Images without annotations get an empty label file unless skip_empty is set.
     """
     
-    def __init__(self, class_manager: ClassManager, version: str = "v8"):
+    def __init__(self, class_manager: ClassManager, version: str = "v8",
+                 skip_empty: bool = False):
         super().__init__(class_manager)
         self.version = version  # For info, format is same
+        self.skip_empty = skip_empty  # Don't create empty label files
     
     def get_format_name(self) -> str:
         return f"YOLO {self.version}"
@@ -78,58 +216,54 @@ class YOLOExporter(BaseExporter):
         image_files: List[Path]
     ) -> int:
         output_dir.mkdir(parents=True, exist_ok=True)
-        count = 0
-        total = len(image_files)
-        
-        for i, image_path in enumerate(image_files):
-            key = str(image_path)
-            annotations = annotations_dict.get(key)
-            
-            if annotations is None:
-                annotations = ImageAnnotations(
-                    image_path=key, 
-                    image_width=0, 
-                    image_height=0
-                )
-            
-            # Create TXT file
-            txt_path = output_dir / f"{image_path.stem}.txt"
-            lines = []
-            
-            # Write BBoxes
-            for bbox in annotations.bboxes:
-                lines.append(
-                    f"{bbox.class_id} {bbox.x_center:.6f} {bbox.y_center:.6f} "
-                    f"{bbox.width:.6f} {bbox.height:.6f}"
-                )
-            
-            # Write Polygons
-            for polygon in annotations.polygons:
-                if len(polygon.points) >= 3:
-                    points_str = " ".join(
-                        f"{x:.6f} {y:.6f}" for x, y in polygon.points
-                    )
-                    lines.append(f"{polygon.class_id} {points_str}")
-            
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-            
-            count += 1
-            self._report_progress(i + 1, total)
+        count = self._run_per_image(self._export_image, annotations_dict, output_dir, image_files)
         
         # Save classes.txt
         self._save_classes_txt(output_dir)
         
         return count
     
+    def _export_image(
+        self,
+        image_path: Path,
+        annotations: ImageAnnotations,
+        output_dir: str
+    ):
+        """Write the label file of a single image (thread-safe)."""
+        # Create TXT file (whole payload built in memory, written once)
+        txt_path = os.path.join(output_dir, image_path.stem + ".txt")
+        if not annotations.bboxes and not annotations.polygons:
+            # Unlabeled image: empty label file (or none at all)
+            if not self.skip_empty:
+                open(txt_path, "wb").close()
+            return
+        buf = _label_buffer()
+        
+        # Write BBoxes
+        for bbox in annotations.bboxes:
+            buf += _YOLO_BBOX_LINE % (
+                bbox.class_id, bbox.x_center, bbox.y_center, bbox.width, bbox.height
+            )
+        
+        # Write Polygons
+        for polygon in annotations.polygons:
+            if polygon.is_valid:
+                points = polygon.points
+                buf += _yolo_polygon_line(len(points)) % (
+                    polygon.class_id, *[c for point in points for c in point]
+                )
+        
+        if not buf and self.skip_empty:
+            return  # Only invalid polygons: counts as unlabeled
+        
+        # Lines are newline-joined (no trailing newline)
+        with open(txt_path, "wb") as f:
+            f.write(memoryview(buf)[:-1])
+    
     def _save_classes_txt(self, output_dir: Path):
         """Save classes.txt file."""
-        classes_path = output_dir / "classes.txt"
-        lines = []
-        for cls in self.class_manager.classes:
-            lines.append(cls.name)
-        with open(classes_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        self._refresh_class_cache()
+        (output_dir / "classes.txt").write_bytes(self._classes_txt)
 
 
 class COCOExporter(BaseExporter):
@@ -144,8 +278,16 @@ class COCOExporter(BaseExporter):
         "images": [...],
         "annotations": [...]
     }
+    
+    Output is compact JSON; pass pretty=True for an indented file.
     """
     
+    def __init__(self, class_manager: ClassManager, pretty: bool = False):
+        super().__init__(class_manager)
+        self.pretty = pretty
+        self._categories: List[Dict] = []
+        self._categories_version = -1
+    
     def get_format_name(self) -> str:
         return "COCO JSON"
     
@@ -157,7 +299,7 @@ class COCOExporter(BaseExporter):
     ) -> int:
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        coco_data = {
+        header = {
             "info": {
                 "description": "LocalTagger Export",
                 "version": "1.0",
@@ -165,104 +307,147 @@ class COCOExporter(BaseExporter):
                 "date_created": datetime.datetime.now().isoformat()
             },
             "licenses": [],
-            "categories": [],
-            "images": [],
-            "annotations": []
+            "categories": self._get_categories()
         }
         
-        # Add categories
-        for cls in self.class_manager.classes:
-            coco_data["categories"].append({
-                "id": cls.id,
-                "name": cls.name,
-                "supercategory": "object"
-            })
-        
-        annotation_id = 1
         total = len(image_files)
+        self._last_reported = 0  # New export run
+        image_annotations = self._lookup_annotations(annotations_dict, image_files)
         
-        for i, image_path in enumerate(image_files):
-            key = str(image_path)
-            annotations = annotations_dict.get(key)
+        # Stream the file: images go straight to disk, annotations are spooled to a
+        # temporary file and appended after the images array (keeps memory at O(1 image))
+        json_path = output_dir / "annotations.json"
+        with open(json_path, "wb") as f, tempfile.TemporaryFile() as ann_file:
+            f.write(dumps_json(header)[:-1])  # Leave the object open
+            f.write(b',"images":[')
             
-            if annotations is None:
-                annotations = ImageAnnotations(
-                    image_path=key, 
-                    image_width=0, 
-                    image_height=0
+            image_id = annotation_id = 1
+            for image_path, annotations in zip(image_files, image_annotations):
+                image_entry, records = self._build_image_records(
+                    annotations, image_path.name, image_id, annotation_id
                 )
+                if image_id > 1:
+                    f.write(b",")
+                f.write(dumps_json(image_entry))
+                if records:
+                    if annotation_id > 1:
+                        ann_file.write(b",")
+                    ann_file.write(b",".join(map(dumps_json, records)))
+                    annotation_id += len(records)
+                
+                self._report_progress(image_id, total)
+                image_id += 1
             
-            image_id = i + 1
-            
-            # Image info
-            coco_data["images"].append({
-                "id": image_id,
-                "file_name": image_path.name,
-                "width": annotations.image_width,
-                "height": annotations.image_height
-            })
-            
-            img_w = annotations.image_width or 1
-            img_h = annotations.image_height or 1
+            f.write(b'],"annotations":[')
+            ann_file.seek(0)
+            shutil.copyfileobj(ann_file, f)
+            f.write(b"]}")
+        
+        if self.pretty:
+            # Opt-in: re-serialize the streamed file with indentation
+            _write_json(json.loads(json_path.read_bytes()), json_path, pretty=True)
+        
+        return len(image_files)
+    
+    def _get_categories(self) -> List[Dict]:
+        """COCO categories, rebuilt only when the classes changed."""
+        self._refresh_class_cache()
+        if self._categories_version != self._class_version:
+            self._categories = [
+                {"id": class_id, "name": name, "supercategory": "object"}
+                for class_id, name in self._class_names.items()
+            ]
+            self._categories_version = self._class_version
+        return self._categories
+    
+    @staticmethod
+    def _build_image_records(
+        annotations: ImageAnnotations,
+        file_name: str,
+        image_id: int,
+        annotation_id: int
+    ) -> Tuple[Dict, List[Dict]]:
+        """
+        Build the COCO image entry and annotation records of one image.
+        
+        Annotation IDs are assigned sequentially starting at annotation_id.
+        """
+        # Image info
+        image_entry = {
+            "id": image_id,
+            "file_name": file_name,
+            "width": annotations.image_width,
+            "height": annotations.image_height
+        }
+        records = []
+        
+        img_w = annotations.image_width or 1
+        img_h = annotations.image_height or 1
+        
+        # BBox annotations (all boxes of the image computed at once)
+        if annotations.bboxes:
+            class_ids, bb = annotations.bbox_array()
+            # COCO bbox: [x, y, width, height] (top-left corner + size)
+            xywh = np.empty_like(bb)
+            xywh[:, 0] = (bb[:, 0] - bb[:, 2] / 2) * img_w
+            xywh[:, 1] = (bb[:, 1] - bb[:, 3] / 2) * img_h
+            xywh[:, 2] = bb[:, 2] * img_w
+            xywh[:, 3] = bb[:, 3] * img_h
+            areas = np.round(xywh[:, 2] * xywh[:, 3], 2).tolist()
+            xywh = np.round(xywh, 2).tolist()
             
-            # BBox annotations
-            for bbox in annotations.bboxes:
-                # COCO bbox: [x, y, width, height] (top-left corner + size)
-                x = (bbox.x_center - bbox.width / 2) * img_w
-                y = (bbox.y_center - bbox.height / 2) * img_h
-                w = bbox.width * img_w
-                h = bbox.height * img_h
-                area = w * h
-                
-                coco_data["annotations"].append({
-                    "id": annotation_id,
+            records = [
+                {
+                    "id": ann_id,
                     "image_id": image_id,
-                    "category_id": bbox.class_id,
-                    "bbox": [round(x, 2), round(y, 2), round(w, 2), round(h, 2)],
-                    "area": round(area, 2),
+                    "category_id": class_id,
+                    "bbox": box,
+                    "area": area,
                     "iscrowd": 0
-                })
-                annotation_id += 1
+                }
+                for ann_id, class_id, box, area in zip(
+                    itertools.count(annotation_id), class_ids.tolist(), xywh, areas
+                )
+            ]
+            annotation_id += len(records)
+        
+        # Polygon annotations (segmentation) - points of all polygons in one array
+        polygons = [p for p in annotations.polygons if p.is_valid]
+        if polygons:
+            lengths = [len(p.points) for p in polygons]
+            starts = np.cumsum([0] + lengths[:-1])
+            pts = np.array(
+                [point for p in polygons for point in p.points], dtype=np.float64
+            ) * (img_w, img_h)
             
-            # Polygon annotations (segmentation)
-            for polygon in annotations.polygons:
-                if len(polygon.points) >= 3:
-                    # Segmentation: [x1, y1, x2, y2, ...] (flat list)
-                    segmentation = []
-                    for x, y in polygon.points:
-                        segmentation.extend([
-                            round(x * img_w, 2), 
-                            round(y * img_h, 2)
-                        ])
-                    
-                    # Calculate bounding box
-                    xs = [p[0] * img_w for p in polygon.points]
-                    ys = [p[1] * img_h for p in polygon.points]
-                    x_min, x_max = min(xs), max(xs)
-                    y_min, y_max = min(ys), max(ys)
-                    w = x_max - x_min
-                    h = y_max - y_min
-                    area = w * h  # Approximate area
-                    
-                    coco_data["annotations"].append({
-                        "id": annotation_id,
-                        "image_id": image_id,
-                        "category_id": polygon.class_id,
-                        "segmentation": [segmentation],
-                        "bbox": [round(x_min, 2), round(y_min, 2), round(w, 2), round(h, 2)],
-                        "area": round(area, 2),
-                        "iscrowd": 0
-                    })
-                    annotation_id += 1
+            # Segmentation: [x1, y1, x2, y2, ...] (flat list per polygon)
+            flat = np.round(pts, 2).ravel().tolist()
             
-            self._report_progress(i + 1, total)
-        
-        # Save JSON file
-        json_path = output_dir / "annotations.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(coco_data, f, indent=2, ensure_ascii=False)
+            # Per-polygon bounding boxes via segmented reductions
+            mins = np.minimum.reduceat(pts, starts, axis=0)
+            maxs = np.maximum.reduceat(pts, starts, axis=0)
+            sizes = maxs - mins
+            areas = np.round(sizes[:, 0] * sizes[:, 1], 2).tolist()  # Approximate area
+            boxes = np.round(np.hstack([mins, sizes]), 2).tolist()
+            
+            # Flat-list offsets of each polygon (2 values per point)
+            ends = (2 * np.cumsum(lengths)).tolist()
+            records += [
+                {
+                    "id": ann_id,
+                    "image_id": image_id,
+                    "category_id": polygon.class_id,
+                    "segmentation": [flat[2 * start:end]],
+                    "bbox": box,
+                    "area": area,
+                    "iscrowd": 0
+                }
+                for ann_id, polygon, start, end, box, area in zip(
+                    itertools.count(annotation_id), polygons, starts.tolist(), ends, boxes, areas
+                )
+            ]
         
-        return len(image_files)
+        return image_entry, records
 
 
 class CustomTXTExporter(BaseExporter):
@@ -276,9 +461,41 @@ class CustomTXTExporter(BaseExporter):
     - {x1_pixel}, {y1_pixel}, {x2_pixel}, {y2_pixel}
     """
     
-    def __init__(self, class_manager: ClassManager, format_string: str):
+    # Placeholder groups - a group is only computed if the format string uses it
+    _CENTER_FIELDS = frozenset({"x_center", "y_center", "width", "height"})
+    _CORNER_FIELDS = frozenset({"x1", "y1", "x2", "y2"})
+    _PIXEL_FIELDS = frozenset({"x1_pixel", "y1_pixel", "x2_pixel", "y2_pixel"})
+    
+    def __init__(self, class_manager: ClassManager, format_string: str,
+                 skip_empty: bool = False):
         super().__init__(class_manager)
         self.format_string = format_string
+        self.skip_empty = skip_empty  # Don't create empty label files
+    
+    @property
+    def format_string(self) -> str:
+        return self._format_string
+    
+    @format_string.setter
+    def format_string(self, format_string: str):
+        """Set format string and pre-parse its placeholders once."""
+        self._format_string = format_string
+        self._format = format_string.format_map  # Bound once, fills from the values dict as-is
+        
+        fields = set()
+        try:
+            for _, field_name, _, _ in string.Formatter().parse(format_string):
+                if field_name:
+                    # "x1.real" / "x1[0]" -> "x1"
+                    fields.add(re.split(r"[.\[]", field_name, maxsplit=1)[0])
+        except ValueError:
+            # Malformed format string: compute everything, format() reports the error at export
+            fields = {"class_name"} | self._CENTER_FIELDS | self._CORNER_FIELDS | self._PIXEL_FIELDS
+        
+        self._needs_name = "class_name" in fields
+        self._needs_center = not self._CENTER_FIELDS.isdisjoint(fields)
+        self._needs_corners = not self._CORNER_FIELDS.isdisjoint(fields)
+        self._needs_pixels = not self._PIXEL_FIELDS.isdisjoint(fields)
     
     def get_format_name(self) -> str:
         return "Custom TXT"
@@ -290,93 +507,99 @@ class CustomTXTExporter(BaseExporter):
         image_files: List[Path]
     ) -> int:
         output_dir.mkdir(parents=True, exist_ok=True)
-        count = 0
-        total = len(image_files)
+        self._refresh_class_cache()
+        return self._run_per_image(self._export_image, annotations_dict, output_dir, image_files)
+    
+    def _export_image(
+        self,
+        image_path: Path,
+        annotations: ImageAnnotations,
+        output_dir: str
+    ):
+        """Write the label file of a single image (thread-safe)."""
+        txt_path = os.path.join(output_dir, image_path.stem + ".txt")
+        buf = _label_buffer()
         
-        for i, image_path in enumerate(image_files):
-            key = str(image_path)
-            annotations = annotations_dict.get(key)
-            
-            if annotations is None:
-                annotations = ImageAnnotations(
-                    image_path=key, 
-                    image_width=0, 
-                    image_height=0
-                )
-            
-            txt_path = output_dir / f"{image_path.stem}.txt"
-            lines = []
-            
-            img_w = annotations.image_width or 1
-            img_h = annotations.image_height or 1
-            
-            # Write BBoxes
-            for bbox in annotations.bboxes:
-                line = self._format_bbox(bbox, img_w, img_h)
-                lines.append(line)
-            
-            # Write Polygons as BBox (bounding box)
-            for polygon in annotations.polygons:
-                if len(polygon.points) >= 3:
-                    # Convert Polygon to bounding box
-                    xs = [p[0] for p in polygon.points]
-                    ys = [p[1] for p in polygon.points]
-                    x_min, x_max = min(xs), max(xs)
-                    y_min, y_max = min(ys), max(ys)
-                    
-                    fake_bbox = BoundingBox(
-                        class_id=polygon.class_id,
-                        x_center=(x_min + x_max) / 2,
-                        y_center=(y_min + y_max) / 2,
-                        width=x_max - x_min,
-                        height=y_max - y_min
-                    )
-                    line = self._format_bbox(fake_bbox, img_w, img_h)
-                    lines.append(line)
-            
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-            
-            count += 1
-            self._report_progress(i + 1, total)
+        img_w = annotations.image_width or 1
+        img_h = annotations.image_height or 1
         
-        return count
+        # Write BBoxes
+        for bbox in annotations.bboxes:
+            buf += self._format_bbox(bbox, img_w, img_h).encode("utf-8")
+            buf += b"\n"
+        
+        # Write Polygons as BBox (bounding box)
+        for polygon in annotations.polygons:
+            if polygon.is_valid:
+                # Convert Polygon to bounding box
+                x_min, y_min, x_max, y_max = polygon.bounds
+                
+                buf += self._format_fields(
+                    polygon.class_id,
+                    (x_min + x_max) / 2, (y_min + y_max) / 2,
+                    x_max - x_min, y_max - y_min,
+                    img_w, img_h
+                ).encode("utf-8")
+                buf += b"\n"
+        
+        if not buf and self.skip_empty:
+            return
+        
+        # Lines are newline-joined (no trailing newline)
+        with open(txt_path, "wb") as f:
+            f.write(memoryview(buf)[:-1])
     
     def _format_bbox(self, bbox: BoundingBox, img_w: int, img_h: int) -> str:
         """Format bbox according to format string."""
-        # Corner coordinates (normalized)
-        x1 = bbox.x_center - bbox.width / 2
-        y1 = bbox.y_center - bbox.height / 2
-        x2 = bbox.x_center + bbox.width / 2
-        y2 = bbox.y_center + bbox.height / 2
-        
-        # Pixel coordinates
-        x1_pixel = int(x1 * img_w)
-        y1_pixel = int(y1 * img_h)
-        x2_pixel = int(x2 * img_w)
-        y2_pixel = int(y2 * img_h)
+        return self._format_fields(
+            bbox.class_id, bbox.x_center, bbox.y_center, bbox.width, bbox.height, img_w, img_h
+        )
+    
+    def _format_fields(
+        self,
+        class_id: int,
+        x_center: float,
+        y_center: float,
+        width: float,
+        height: float,
+        img_w: int,
+        img_h: int
+    ) -> str:
+        """Format a normalized box given as primitives (only used placeholders are computed)."""
+        values = {"class_id": class_id}
         
         # Class name
-        label_class = self.class_manager.get_by_id(bbox.class_id)
-        class_name = label_class.name if label_class else str(bbox.class_id)
+        if self._needs_name:
+            values["class_name"] = self._class_names.get(class_id, str(class_id))
+        
+        if self._needs_center:
+            values["x_center"] = f"{x_center:.6f}"
+            values["y_center"] = f"{y_center:.6f}"
+            values["width"] = f"{width:.6f}"
+            values["height"] = f"{height:.6f}"
+        
+        if self._needs_corners or self._needs_pixels:
+            # Corner coordinates (normalized)
+            x1 = x_center - width / 2
+            y1 = y_center - height / 2
+            x2 = x_center + width / 2
+            y2 = y_center + height / 2
+            
+            if self._needs_corners:
+                values["x1"] = f"{x1:.6f}"
+                values["y1"] = f"{y1:.6f}"
+                values["x2"] = f"{x2:.6f}"
+                values["y2"] = f"{y2:.6f}"
+            
+            # Pixel coordinates
+            if self._needs_pixels:
+                values["x1_pixel"] = int(x1 * img_w)
+                values["y1_pixel"] = int(y1 * img_h)
+                values["x2_pixel"] = int(x2 * img_w)
+                values["y2_pixel"] = int(y2 * img_h)
         
         # Fill format string
-        return self.format_string.format(
-            class_id=bbox.class_id,
-            class_name=class_name,
-            x_center=f"{bbox.x_center:.6f}",
-            y_center=f"{bbox.y_center:.6f}",
-            width=f"{bbox.width:.6f}",
-            height=f"{bbox.height:.6f}",
-            x1=f"{x1:.6f}",
-            y1=f"{y1:.6f}",
-            x2=f"{x2:.6f}",
-            y2=f"{y2:.6f}",
-            x1_pixel=x1_pixel,
-            y1_pixel=y1_pixel,
-            x2_pixel=x2_pixel,
-            y2_pixel=y2_pixel
-        )
+        return self._format(values)
 
 
 class CustomJSONExporter(BaseExporter):
@@ -391,9 +614,11 @@ class CustomJSONExporter(BaseExporter):
     - {{annotations}} - Special marker for Annotation list
     """
     
-    def __init__(self, class_manager: ClassManager, template: Dict[str, Any]):
+    def __init__(self, class_manager: ClassManager, template: Dict[str, Any],
+                 pretty: bool = False):
         super().__init__(class_manager)
         self.template = template
+        self.pretty = pretty  # Indented output (compact by default)
     
     def get_format_name(self) -> str:
         return "Custom JSON"
@@ -405,6 +630,7 @@ class CustomJSONExporter(BaseExporter):
         image_files: List[Path]
     ) -> int:
         output_dir.mkdir(parents=True, exist_ok=True)
+        self._refresh_class_cache()
         
         result = {
             "info": {
@@ -415,96 +641,89 @@ class CustomJSONExporter(BaseExporter):
         }
         
         total = len(image_files)
+        self._last_reported = 0  # New export run
         
-        for i, image_path in enumerate(image_files):
-            key = str(image_path)
-            annotations = annotations_dict.get(key)
-            
-            if annotations is None:
-                annotations = ImageAnnotations(
-                    image_path=key, 
-                    image_width=0, 
-                    image_height=0
-                )
-            
+        # Bound once outside the per-image / per-annotation loops
+        add_image = result["images"].append
+        format_annotations = self._format_annotations
+        format_polygon = self._format_polygon
+        report = self._report_progress
+        
+        image_annotations = self._lookup_annotations(annotations_dict, image_files)
+        for i, (image_path, annotations) in enumerate(zip(image_files, image_annotations)):
             img_w = annotations.image_width or 1
             img_h = annotations.image_height or 1
             
-            image_data = {
+            # BBoxes, then Polygons
+            image_annotations_data = format_annotations(annotations, img_w, img_h)
+            image_annotations_data += [
+                format_polygon(polygon, img_w, img_h)
+                for polygon in annotations.polygons if polygon.is_valid
+            ]
+            
+            add_image({
                 "file_name": image_path.name,
                 "width": img_w,
                 "height": img_h,
-                "annotations": []
-            }
-            
-            # BBoxes
-            for bbox in annotations.bboxes:
-                ann_data = self._format_annotation(bbox, img_w, img_h)
-                image_data["annotations"].append(ann_data)
-            
-            # Polygons
-            for polygon in annotations.polygons:
-                if len(polygon.points) >= 3:
-                    ann_data = self._format_polygon(polygon, img_w, img_h)
-                    image_data["annotations"].append(ann_data)
-            
-            result["images"].append(image_data)
-            self._report_progress(i + 1, total)
+                "annotations": image_annotations_data
+            })
+            report(i + 1, total)
         
         # Save JSON file
-        json_path = output_dir / "custom_annotations.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        _write_json(result, output_dir / "custom_annotations.json", pretty=self.pretty)
         
         return len(image_files)
     
-    def _format_annotation(self, bbox: BoundingBox, img_w: int, img_h: int) -> Dict:
-        """Format annotation for BBox."""
-        label_class = self.class_manager.get_by_id(bbox.class_id)
-        class_name = label_class.name if label_class else str(bbox.class_id)
+    def _format_annotations(self, annotations: ImageAnnotations, img_w: int, img_h: int) -> List[Dict]:
+        """Format annotations for all BBoxes of an image (values computed for all boxes at once)."""
+        if not annotations.bboxes:
+            return []
+        
+        class_ids, xywh = annotations.bbox_array()
         
         # Corner coordinates
-        x1 = bbox.x_center - bbox.width / 2
-        y1 = bbox.y_center - bbox.height / 2
-        x2 = bbox.x_center + bbox.width / 2
-        y2 = bbox.y_center + bbox.height / 2
+        half = xywh[:, 2:] / 2
+        corners = np.hstack([xywh[:, :2] - half, xywh[:, :2] + half])
         
-        return {
-            "type": "bbox",
-            "class_id": bbox.class_id,
-            "class_name": class_name,
-            "x_center": round(bbox.x_center, 6),
-            "y_center": round(bbox.y_center, 6),
-            "width": round(bbox.width, 6),
-            "height": round(bbox.height, 6),
-            "x1": round(x1, 6),
-            "y1": round(y1, 6),
-            "x2": round(x2, 6),
-            "y2": round(y2, 6),
-            "x1_pixel": int(x1 * img_w),
-            "y1_pixel": int(y1 * img_h),
-            "x2_pixel": int(x2 * img_w),
-            "y2_pixel": int(y2 * img_h)
-        }
+        # Rows: x_center, y_center, width, height, x1, y1, x2, y2
+        values = np.round(np.hstack([xywh, corners]), 6).tolist()
+        pixels = (corners * (img_w, img_h, img_w, img_h)).astype(np.int64).tolist()
+        
+        class_names = self._class_names
+        return [
+            {
+                "type": "bbox",
+                "class_id": class_id,
+                "class_name": class_names.get(class_id, str(class_id)),
+                "x_center": x_center,
+                "y_center": y_center,
+                "width": width,
+                "height": height,
+                "x1": x1,
+                "y1": y1,
+                "x2": x2,
+                "y2": y2,
+                "x1_pixel": x1_pixel,
+                "y1_pixel": y1_pixel,
+                "x2_pixel": x2_pixel,
+                "y2_pixel": y2_pixel
+            }
+            for class_id, (x_center, y_center, width, height, x1, y1, x2, y2),
+                (x1_pixel, y1_pixel, x2_pixel, y2_pixel)
+            in zip(class_ids.tolist(), values, pixels)
+        ]
     
     def _format_polygon(self, polygon: Polygon, img_w: int, img_h: int) -> Dict:
         """Format annotation for Polygon."""
-        label_class = self.class_manager.get_by_id(polygon.class_id)
-        class_name = label_class.name if label_class else str(polygon.class_id)
+        class_name = self._class_names.get(polygon.class_id, str(polygon.class_id))
         
-        # Normalized and pixel coordinates
-        points_normalized = [
-            {"x": round(x, 6), "y": round(y, 6)} 
-            for x, y in polygon.points
-        ]
+        # Normalized and pixel coordinates, rounded / truncated for all points at once
+        pts = np.asarray(polygon.points, dtype=np.float64)
+        points_normalized = [{"x": x, "y": y} for x, y in np.round(pts, 6).tolist()]
         points_pixel = [
-            {"x": int(x * img_w), "y": int(y * img_h)} 
-            for x, y in polygon.points
+            {"x": x, "y": y} for x, y in (pts * (img_w, img_h)).astype(np.int64).tolist()
         ]
-        
-        # Calculate bounding box
-        xs = [p[0] for p in polygon.points]
-        ys = [p[1] for p in polygon.points]
+        x_min, y_min, x_max, y_max = polygon.bounds
         
         return {
             "type": "polygon",
@@ -513,9 +732,9 @@ class CustomJSONExporter(BaseExporter):
             "points": points_normalized,
             "points_pixel": points_pixel,
             "bbox": {
-                "x1": round(min(xs), 6),
-                "y1": round(min(ys), 6),
-                "x2": round(max(xs), 6),
-                "y2": round(max(ys), 6)
+                "x1": round(x_min, 6),
+                "y1": round(y_min, 6),
+                "x2": round(x_max, 6),
+                "y2": round(y_max, 6)
             }
         }
@@ -4,9 +4,10 @@ Image Loader
 Image loading, caching and lazy loading.
 """
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtGui import QPixmap, QImage, QImageReader
 from PySide6.QtCore import QSize
 
 
@@ -21,9 +22,12 @@ class ImageLoader:
         Args:
             cache_size: Max number of images to keep in cache
         """
-        self._cache: dict[Path, QPixmap] = {}
-        self._cache_order: list[Path] = []
+        # Least recently used first
+        self._cache: OrderedDict[Path, QPixmap] = OrderedDict()
         self._cache_size = cache_size
+        # Thumbnails are cached separately so they don't evict full images
+        self._thumb_cache: OrderedDict[tuple[Path, int, int], QPixmap] = OrderedDict()
+        self._thumb_cache_size = cache_size * 10
         
     def load(self, image_path: Path | str) -> Optional[QPixmap]:
         """
@@ -38,8 +42,10 @@ class ImageLoader:
         path = Path(image_path)
         
         # Check if in cache
-        if path in self._cache:
-            return self._cache[path]
+        pixmap = self._cache.get(path)
+        if pixmap is not None:
+            self._cache.move_to_end(path)
+            return pixmap
             
         # Load from disk
         pixmap = QPixmap(str(path))
@@ -59,6 +65,9 @@ class ImageLoader:
         """
         Loads a scaled thumbnail for image.
         
+        The image is scaled while decoding (QImageReader.setScaledSize), so
+        the full resolution image is never decoded into memory.
+        
         Args:
             image_path: Path to image file
             size: Thumbnail size
@@ -66,30 +75,45 @@ class ImageLoader:
         Returns:
             Scaled QPixmap
         """
-        pixmap = self.load(image_path)
-        if pixmap is None:
+        path = Path(image_path)
+        key = (path, size.width(), size.height())
+        
+        thumbnail = self._thumb_cache.get(key)
+        if thumbnail is not None:
+            self._thumb_cache.move_to_end(key)
+            return thumbnail
+        
+        reader = QImageReader(str(path))
+        reader.setAutoTransform(True)  # Same orientation as QPixmap(path)
+        original_size = reader.size()
+        if original_size.isValid():
+            reader.setScaledSize(
+                original_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatio)
+            )
+        image = reader.read()
+        if image.isNull():
             return None
-            
-        return pixmap.scaled(
-            size,
-            aspectMode=Qt.AspectRatioMode.KeepAspectRatio,
-            mode=Qt.TransformationMode.SmoothTransformation
-        )
+        
+        thumbnail = QPixmap.fromImage(image)
+        self._thumb_cache[key] = thumbnail
+        if len(self._thumb_cache) > self._thumb_cache_size:
+            self._thumb_cache.popitem(last=False)
+        
+        return thumbnail
     
     def _add_to_cache(self, path: Path, pixmap: QPixmap):
         """Adds image to cache, removes old items if needed."""
-        # If cache is full, remove oldest item
-        if len(self._cache_order) >= self._cache_size:
-            oldest = self._cache_order.pop(0)
-            del self._cache[oldest]
-            
         self._cache[path] = pixmap
-        self._cache_order.append(path)
+        self._cache.move_to_end(path)
+        
+        # If cache is full, remove least recently used item
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
         
     def clear_cache(self):
         """Clears cache."""
         self._cache.clear()
-        self._cache_order.clear()
+        self._thumb_cache.clear()
 
 
 # Qt import for thumbnail scaling
@@ -4,8 +4,9 @@ Language Manager
 Multi-language support management with Qt Linguist.
 """
 
+import os
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from PySide6.QtCore import QObject, QTranslator, QLocale, QCoreApplication, QSettings
 
 
@@ -31,11 +32,22 @@ class LanguageManager(QObject):
         super().__init__()
         self._app = app
         self._translator: Optional[QTranslator] = None
+        # Loaded translators, reused on switch (None: no translation available)
+        self._translators: Dict[str, Optional[QTranslator]] = {}
         self._current_language = "en"
         self._settings = QSettings("LocalTagger", "Preferences")
+        self._saved_language: Optional[str] = None
         
         from utils.path_utils import get_resource_path
         self._translations_dir = get_resource_path("translations")
+        # Available .qm files, indexed once: {lang_code: path}
+        self._qm_files: Dict[str, Path] = {}
+        if os.path.isdir(self._translations_dir):
+            with os.scandir(self._translations_dir) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext == ".qm":
+                        self._qm_files[stem] = Path(entry.path)
     
     @property
     def current_language(self) -> str:
@@ -62,6 +74,7 @@ class LanguageManager(QObject):
             True if loaded successfully
         """
         saved_lang = self._settings.value("language", "en")
+        self._saved_language = saved_lang
         return self.set_language(saved_lang)
     
     def set_language(self, lang_code: str) -> bool:
@@ -74,6 +87,12 @@ class LanguageManager(QObject):
         Returns:
             True if successful
         """
+        # Already active - nothing to do
+        if lang_code == self._current_language and (
+            lang_code == "en" or self._translator is not None
+        ):
+            return True
+        
         # Remove current translator
         if self._translator is not None:
             self._app.removeTranslator(self._translator)
@@ -83,26 +102,20 @@ class LanguageManager(QObject):
         
         # English is default - no need to load translation file
         if lang_code == "en":
-            self._settings.setValue("language", lang_code)
+            self._save_language(lang_code)
             return True
         
-        # Load translation file for other languages
-        self._translator = QTranslator()
-        
-        # Translation file paths
-        qm_file = self._translations_dir / f"{lang_code}.qm"
+        # Load translation file for other languages (once per language, misses included)
+        if lang_code in self._translators:
+            translator = self._translators[lang_code]
+        else:
+            translator = self._load_translator(lang_code)
+            self._translators[lang_code] = translator
         
-        if qm_file.exists():
-            if self._translator.load(str(qm_file)):
-                self._app.installTranslator(self._translator)
-                self._settings.setValue("language", lang_code)
-                return True
-        
-        # Fallback: Use Qt's locale system
-        locale = QLocale(lang_code)
-        if self._translator.load(locale, "localtagger", "_", str(self._translations_dir)):
-            self._app.installTranslator(self._translator)
-            self._settings.setValue("language", lang_code)
+        if translator is not None:
+            self._app.installTranslator(translator)
+            self._translator = translator
+            self._save_language(lang_code)
             return True
         
         # Translation file not found - revert to English
@@ -110,6 +123,29 @@ class LanguageManager(QObject):
         self._current_language = "en"
         return False
     
+    def _load_translator(self, lang_code: str) -> Optional[QTranslator]:
+        """Loads the translator of a language, None if no translation file is found."""
+        translator = QTranslator()
+        
+        # Translation file (Qt memory-maps it, no copy is read into Python)
+        qm_file = self._qm_files.get(lang_code)
+        if qm_file is not None:
+            if translator.load(str(qm_file)):
+                return translator
+        
+        # Fallback: Use Qt's locale system
+        locale = QLocale(lang_code)
+        if translator.load(locale, "localtagger", "_", str(self._translations_dir)):
+            return translator
+        
+        return None
+    
+    def _save_language(self, lang_code: str):
+        """Saves language preference (only written when it changes)."""
+        if lang_code != self._saved_language:
+            self._settings.setValue("language", lang_code)
+            self._saved_language = lang_code
+    
     def is_language_available(self, lang_code: str) -> bool:
         """Is language available?"""
         return any(code == lang_code for code, _ in self.LANGUAGES)
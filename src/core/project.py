@@ -4,6 +4,7 @@ Project Management
 Project opening, saving and state management.
 """
 
+import os
 from pathlib import Path
 from typing import Optional, List
 from dataclasses import dataclass, field
@@ -42,11 +43,19 @@ class Project:
         if not self.root_path.exists():
             return 0
             
-        # Find files in supported formats
-        for file_path in sorted(self.root_path.iterdir()):
-            if file_path.suffix.lower() in self.SUPPORTED_FORMATS:
-                self.image_files.append(file_path)
-                
+        # Find files in supported formats: filter on the raw names and sort
+        # only the kept ones, then build the Path objects
+        # (splitext like Path.suffix: a dotfile such as ".jpg" has no extension)
+        formats = self.SUPPORTED_FORMATS
+        splitext = os.path.splitext
+        with os.scandir(self.root_path) as entries:
+            names = [
+                entry.name for entry in entries
+                if splitext(entry.name)[1].lower() in formats and entry.is_file()
+            ]
+        names.sort(key=os.path.normcase)  # Same order as sorting Paths (case-insensitive on Windows)
+        self.image_files = [self.root_path / name for name in names]
+        
         return len(self.image_files)
     
     @property
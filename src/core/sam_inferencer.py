@@ -4,6 +4,8 @@ SAM Inferencer Module
 Segmentation with MobileSAM ONNX models.
 """
 
+import os
+import platform
 import cv2
 import numpy as np
 from pathlib import Path
@@ -15,7 +17,7 @@ class SAMInferencer:
     Point-to-mask segmentation with MobileSAM ONNX models.
     
     Usage:
-        inferencer = SAMInferencer(encoder_path, decoder_path)
+        inferencer = SAMInferencer(encoder_path, decoder_path)  # use_int8=True: quantized encoder
         inferencer.load_models()
         inferencer.set_image(image)
         mask = inferencer.infer_point(x, y)
@@ -25,21 +27,81 @@ class SAMInferencer:
     
     INPUT_SIZE = 1024
     
-    def __init__(self, encoder_path: str, decoder_path: str):
+    # Execution providers in order of preference (unavailable ones are skipped)
+    PREFERRED_PROVIDERS = (
+        "CUDAExecutionProvider",
+        "DmlExecutionProvider",      # DirectML (Windows)
+        "CoreMLExecutionProvider",   # macOS
+        "CPUExecutionProvider",
+    )
+    # CUDA provider options: no power-of-two arena growth (VRAM), quick conv algo
+    # pick, and enough cuDNN workspace for the fast (e.g. Winograd) conv kernels
+    CUDA_PROVIDER_OPTIONS = {
+        "device_id": 0,
+        "arena_extend_strategy": "kSameAsRequested",
+        "cudnn_conv_algo_search": "HEURISTIC",
+        "cudnn_conv_use_max_workspace": "1",
+    }
+    PROMPT_POINTS = 5  # Decoder prompt length (real points + padding)
+    
+    # ImageNet normalization, shaped (C, 1, 1) for the CHW encoder input
+    PIXEL_MEAN = np.array([123.675, 116.28, 103.53], dtype=np.float32).reshape(3, 1, 1)
+    PIXEL_INV_STD = (1.0 / np.array([58.395, 57.12, 57.375], dtype=np.float32)).reshape(3, 1, 1)
+    
+    def __init__(self, encoder_path: str, decoder_path: str, use_int8: bool = False,
+                 device: str = "auto", use_fp16: bool = False,
+                 cpu_encoder_path: Optional[str] = None):
         """
         Args:
             encoder_path: Encoder ONNX model path
             decoder_path: Decoder ONNX model path
+            use_int8: Run an INT8 (dynamically quantized) copy of the encoder,
+                created next to the encoder on first use
+            device: "auto" (best available provider), "cuda" (CUDA if available)
+                or "cpu"
+            use_fp16: Run an FP16 copy of the encoder (created next to the encoder
+                on first use) when a GPU provider is used; ignored on CPU, where
+                FP16 is slower. use_int8 takes precedence
+            cpu_encoder_path: Distilled encoder (e.g. MobileSAM) used instead of
+                encoder_path when only the CPU provider is available. Must produce
+                the same (1, 256, 64, 64) embedding, the decoder is shared
         """
-        self.encoder_path = Path(encoder_path)
+        self.encoder_path = Path(encoder_path)  # Encoder in use (see load_models)
+        self.default_encoder_path = self.encoder_path
+        self.cpu_encoder_path = Path(cpu_encoder_path) if cpu_encoder_path else None
         self.decoder_path = Path(decoder_path)
+        self.use_int8 = use_int8
+        self.use_fp16 = use_fp16
+        self.device = device
+        self.active_provider: Optional[str] = None  # Provider running the encoder
+        self.encoder_precision = "fp32"  # Precision of the loaded encoder
+        self.encoder_bytes_saved = 0  # Model file size saved by INT8/FP16
         
         self._encoder_session = None
         self._decoder_session = None
         self._image_embedding = None
+        # Embedding as an OrtValue on the inference device (CUDA: stays in VRAM)
+        self._embedding_value = None
+        self._device = "cpu"  # OrtValue device of the embedding ("cpu" or "cuda")
+        self._encoder_input_name = None
+        self._encoder_output_name = None
+        self._encoder_run_options = None  # RunOptions of the encode in progress
         self._original_size = None  # (height, width)
         self._scale_factor = 1.0
         
+        # Decoder inputs, allocated once and refilled per prompt.
+        # Prompts are padded to 5 points: padding points are (0, 0) with label -1
+        self._point_coords = np.zeros((1, self.PROMPT_POINTS, 2), dtype=np.float32)
+        self._point_labels = np.full((1, self.PROMPT_POINTS), -1, dtype=np.float32)
+        self._mask_input = np.zeros((1, 1, 256, 256), dtype=np.float32)
+        self._has_mask_input = np.zeros(1, dtype=np.float32)
+        self._orig_im_size = np.zeros(2, dtype=np.float32)
+        # IoBinding over the buffers above (built per image, see _bind_decoder_inputs)
+        self._decoder_binding = None
+        self._decoder_input_values = []
+        # Encoder input tensor, allocated on first use and refilled per image
+        self._input_tensor: Optional[np.ndarray] = None
+        
     @property
     def is_loaded(self) -> bool:
         """Are models loaded?"""
@@ -48,44 +110,289 @@ class SAMInferencer:
     @property
     def has_embedding(self) -> bool:
         """Is image embedding calculated?"""
-        return self._image_embedding is not None
+        return self._image_embedding is not None or self._embedding_value is not None
+    
+    @property
+    def embedding(self) -> Optional[np.ndarray]:
+        """Current image embedding (read-only use), None if not set."""
+        if self._image_embedding is None and self._embedding_value is not None:
+            # Device-resident embedding: copied to the host once, on first request
+            self._image_embedding = self._embedding_value.numpy()
+        return self._image_embedding
+    
+    @property
+    def encoder_signature(self) -> str:
+        """
+        Identifies the encoder that produces the embeddings (path, file version,
+        precision). Embeddings cached under another signature are not reusable.
+        """
+        try:
+            mtime = self.encoder_path.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        return f"{self.encoder_path.resolve()}|{mtime}|{self.encoder_precision}"
     
-    def load_models(self):
-        """Start ONNX model sessions."""
+    def load_models(self, warmup: bool = True):
+        """
+        Start ONNX model sessions.
+        
+        Args:
+            warmup: Run encoder_warmup() before returning (False: caller runs it)
+        """
         import onnxruntime
         
+        providers = self._select_providers(onnxruntime.get_available_providers())
+        first_provider = providers[0] if isinstance(providers[0], str) else providers[0][0]
+        
+        # CPU only: the distilled encoder, if there is one (the full one is too slow)
+        self.encoder_path = self.default_encoder_path
+        if first_provider == "CPUExecutionProvider" and self.cpu_encoder_path is not None:
+            self.encoder_path = self.cpu_encoder_path
+        
         if not self.encoder_path.exists():
             raise FileNotFoundError(f"Encoder model not found: {self.encoder_path}")
         if not self.decoder_path.exists():
             raise FileNotFoundError(f"Decoder model not found: {self.decoder_path}")
         
-        providers = ['CPUExecutionProvider']
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        # Physical cores (roughly): hyperthreads don't help the matmul-bound encoder
+        options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+        # Reuse allocations across runs: the arena keeps freed blocks and the
+        # memory pattern (fixed input shapes) plans them up front after the first run
+        options.enable_cpu_mem_arena = True
+        options.enable_mem_pattern = "DmlExecutionProvider" not in providers  # Required by DirectML
+        options.enable_profiling = False
+        # Flush denormals to zero: avoids the slow subnormal float paths on CPU
+        options.add_session_config_entry("session.set_denormal_as_zero", "1")
+        
+        # Reduced precision copy of the encoder (decoder stays FP32: tiny and
+        # numerically sensitive)
+        encoder_path, self.encoder_precision = None, "fp32"
+        if self.use_int8:
+            encoder_path = self._get_int8_encoder_path()
+            if encoder_path is not None:
+                self.encoder_precision = "int8"
+        elif self.use_fp16 and first_provider != "CPUExecutionProvider":
+            encoder_path = self._get_fp16_encoder_path()
+            if encoder_path is not None:
+                self.encoder_precision = "fp16"
+        self.encoder_bytes_saved = (
+            self.encoder_path.stat().st_size - encoder_path.stat().st_size
+            if encoder_path is not None else 0
+        )
+        
         self._encoder_session = onnxruntime.InferenceSession(
-            str(self.encoder_path), providers=providers
+            str(encoder_path or self.encoder_path), sess_options=options, providers=providers
         )
         self._decoder_session = onnxruntime.InferenceSession(
-            str(self.decoder_path), providers=providers
+            str(self.decoder_path), sess_options=options, providers=providers
         )
+        self.active_provider = self._encoder_session.get_providers()[0]
+        self._device = "cuda" if self.active_provider == "CUDAExecutionProvider" else "cpu"
+        self._encoder_input_name = self._encoder_session.get_inputs()[0].name
+        self._encoder_output_name = self._encoder_session.get_outputs()[0].name
+        if warmup:
+            self.encoder_warmup()
     
-    def set_image(self, image: np.ndarray):
+    def _select_providers(self, available: List[str]) -> list:
+        """
+        Execution providers for the sessions, CPU always last as the fallback.
+        
+        Args:
+            available: onnxruntime.get_available_providers()
+        """
+        if self.device == "cpu":
+            names = ["CPUExecutionProvider"]
+        elif self.device == "cuda":
+            names = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+        else:
+            names = list(self.PREFERRED_PROVIDERS)
+        
+        providers = []
+        for name in names:
+            if name not in available:
+                continue
+            if name == "CUDAExecutionProvider":
+                providers.append((name, self.CUDA_PROVIDER_OPTIONS))
+            else:
+                providers.append(name)
+        return providers
+    
+    def encoder_warmup(self):
+        """
+        Run the encoder and the decoder once on dummy inputs.
+        
+        The first run pays ONNX Runtime's kernel selection and memory arena
+        allocation; doing it here hides it in the (async) model loading instead
+        of the first encode/click.
+        """
+        dummy_image = np.zeros((1, 3, self.INPUT_SIZE, self.INPUT_SIZE), dtype=np.float32)
+        embedding = self._encoder_session.run(None, {self._encoder_input_name: dummy_image})[0]
+        
+        self._decoder_session.run(None, {
+            "image_embeddings": embedding,
+            "point_coords": self._point_coords,
+            "point_labels": self._point_labels,
+            "mask_input": self._mask_input,
+            "has_mask_input": self._has_mask_input,
+            "orig_im_size": np.array([self.INPUT_SIZE, self.INPUT_SIZE], dtype=np.float32),
+        })
+    
+    def _get_int8_encoder_path(self) -> Optional[Path]:
+        """
+        Returns the INT8 encoder, quantizing the FP32 encoder on first use.
+        
+        Returns:
+            Quantized model path or None (quantization unavailable/failed: use FP32)
+        """
+        int8_path = self.encoder_path.with_name(f"{self.encoder_path.stem}_int8.onnx")
+        if int8_path.exists():
+            return int8_path
+        
+        try:
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            
+            # Unsigned weights hit the NEON dot-product kernels on ARM
+            is_arm = platform.machine().lower() in ("arm64", "aarch64")
+            quantize_dynamic(
+                str(self.encoder_path), str(int8_path),
+                weight_type=QuantType.QUInt8 if is_arm else QuantType.QInt8,
+                op_types_to_quantize=["MatMul", "Gemm"]
+            )
+            return int8_path
+        except Exception as e:  # onnx not installed, read-only folder, ...
+            print(f"Warning: INT8 encoder unavailable, using FP32: {e}")
+            return None
+    
+    def _get_fp16_encoder_path(self) -> Optional[Path]:
+        """
+        Returns the FP16 encoder, converting the FP32 encoder on first use.
+        
+        Inputs/outputs stay float32 (keep_io_types), so preprocessing and the
+        embedding handling are unchanged.
+        
+        Returns:
+            Converted model path or None (converter unavailable/failed: use FP32)
+        """
+        fp16_path = self.encoder_path.with_name(f"{self.encoder_path.stem}_fp16.onnx")
+        if fp16_path.exists():
+            return fp16_path
+        
+        try:
+            import onnx
+            from onnxconverter_common.float16 import convert_float_to_float16
+            
+            model = convert_float_to_float16(onnx.load(str(self.encoder_path)), keep_io_types=True)
+            onnx.save(model, str(fp16_path))
+            return fp16_path
+        except Exception as e:  # onnxconverter-common not installed, read-only folder, ...
+            print(f"Warning: FP16 encoder unavailable, using FP32: {e}")
+            return None
+    
+    def set_image(self, image: np.ndarray, input_tensor: Optional[np.ndarray] = None):
         """
         Calculate and cache embedding for image.
         
         Args:
             image: numpy array in BGR format (OpenCV)
+            input_tensor: preprocess_image(image) result if already prepared
+                (e.g. on another thread), None to preprocess here
         """
         if not self.is_loaded:
             raise RuntimeError("Models not loaded! Call load_models() first.")
         
-        self._original_size = (image.shape[0], image.shape[1])  # (H, W)
-        
         # Preprocess
-        input_tensor = self._preprocess_image(image)
+        if input_tensor is None:
+            input_tensor = self.preprocess_image(image)
+        
+        # Run Encoder (cancellable from another thread, see cancel_encode)
+        from onnxruntime import RunOptions
+        run_options = RunOptions()
+        self._encoder_run_options = run_options
+        try:
+            if self._device == "cuda":
+                # Keep the embedding in VRAM: it is bound straight to the decoder,
+                # no device -> host -> device round trip
+                binding = self._encoder_session.io_binding()
+                binding.bind_cpu_input(self._encoder_input_name, input_tensor)
+                binding.bind_output(self._encoder_output_name, "cuda", 0)
+                self._encoder_session.run_with_iobinding(binding, run_options)
+                self._set_embedding(None, binding.get_outputs()[0], image.shape[:2])
+            else:
+                outputs = self._encoder_session.run(
+                    None, {self._encoder_input_name: input_tensor}, run_options
+                )
+                self.set_precomputed_embedding(outputs[0], image.shape[:2])
+        finally:
+            self._encoder_run_options = None
+    
+    def cancel_encode(self):
+        """
+        Abort a running set_image (can be called from another thread).
+        
+        ONNX Runtime stops at the next node and set_image raises; the previous
+        embedding is kept. No effect when no encode is running.
+        """
+        run_options = self._encoder_run_options
+        if run_options is not None:
+            run_options.terminate = True
+    
+    def set_precomputed_embedding(self, embedding: np.ndarray, image_size: Tuple[int, int]):
+        """
+        Use an embedding computed earlier for the image (skips the encoder).
         
-        # Run Encoder
-        inputs = {self._encoder_session.get_inputs()[0].name: input_tensor}
-        outputs = self._encoder_session.run(None, inputs)
-        self._image_embedding = outputs[0]
+        Args:
+            embedding: Encoder output for the image
+            image_size: (height, width) of the original image
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Models not loaded! Call load_models() first.")
+        
+        self._set_embedding(np.ascontiguousarray(embedding, dtype=np.float32), None, image_size)
+    
+    def _set_embedding(self, embedding: Optional[np.ndarray], embedding_value, image_size):
+        """Install the embedding of a new image (host array and/or device OrtValue)."""
+        self._original_size = (int(image_size[0]), int(image_size[1]))  # (H, W)
+        self._scale_factor = self.INPUT_SIZE * 1.0 / max(self._original_size)
+        self._image_embedding = embedding
+        self._embedding_value = embedding_value
+        self._orig_im_size[:] = self._original_size
+        self._bind_decoder_inputs()
+    
+    def _bind_decoder_inputs(self):
+        """
+        Bind the decoder inputs for the current image.
+        
+        The prompt OrtValues share memory with the NumPy buffers, so prompts only
+        refill the buffers and run the binding (no per-run input conversion).
+        The embedding is uploaded to the inference device once per image.
+        """
+        from onnxruntime import OrtValue
+        
+        if self._embedding_value is None:
+            self._embedding_value = OrtValue.ortvalue_from_numpy(
+                self._image_embedding, self._device, 0
+            )
+        
+        binding = self._decoder_session.io_binding()
+        binding.bind_ortvalue_input("image_embeddings", self._embedding_value)
+        values = []
+        for name, array in (
+            ("point_coords", self._point_coords),
+            ("point_labels", self._point_labels),
+            ("mask_input", self._mask_input),
+            ("has_mask_input", self._has_mask_input),
+            ("orig_im_size", self._orig_im_size),
+        ):
+            value = OrtValue.ortvalue_from_numpy(array)
+            binding.bind_ortvalue_input(name, value)
+            values.append(value)
+        binding.bind_output("masks", "cpu")
+        
+        self._decoder_input_values = values  # Keep the bound values alive
+        self._decoder_binding = binding
     
     def infer_point(self, x: int, y: int) -> np.ndarray:
         """
@@ -101,53 +408,8 @@ class SAMInferencer:
         if not self.has_embedding:
             raise RuntimeError("Image not set! Call set_image() first.")
         
-        # Scale coordinates
-        onnx_x = x * self._scale_factor
-        onnx_y = y * self._scale_factor
-        
-        # Prepare decoder inputs
-        input_point = np.array([[onnx_x, onnx_y]], dtype=np.float32)
-        input_label = np.array([1], dtype=np.float32)  # 1 = foreground
-        
-        # 5 points specific (1 real + 4 dummy)
-        onnx_coord = np.concatenate([
-            input_point, 
-            np.array([[0.0, 0.0]] * 4, dtype=np.float32)
-        ], axis=0)[None, :, :]
-        
-        onnx_label = np.concatenate([
-            input_label, 
-            np.array([-1] * 4, dtype=np.float32)
-        ], axis=0)[None, :]
-        
-        mask_input = np.zeros((1, 1, 256, 256), dtype=np.float32)
-        has_mask_input = np.zeros(1, dtype=np.float32)
-        orig_size = np.array(self._original_size, dtype=np.float32)
-        
-        ort_inputs = {
-            "image_embeddings": self._image_embedding.astype(np.float32),
-            "point_coords": onnx_coord.astype(np.float32),
-            "point_labels": onnx_label.astype(np.float32),
-            "mask_input": mask_input.astype(np.float32),
-            "has_mask_input": has_mask_input.astype(np.float32),
-            "orig_im_size": orig_size.astype(np.float32)
-        }
-        
-        masks, _, _ = self._decoder_session.run(None, ort_inputs)
-        
-        # Create binary mask
-        final_mask = masks[0, 0, :, :]
-        final_mask = (final_mask > 0).astype(np.uint8)
-        
-        # Resize to original size
-        if final_mask.shape[:2] != self._original_size:
-            final_mask = cv2.resize(
-                final_mask, 
-                (self._original_size[1], self._original_size[0]),  # (W, H)
-                interpolation=cv2.INTER_NEAREST
-            )
-        
-        return final_mask
+        # 1 = foreground point
+        return self._decode(((x, y),), (1,))
     
     def infer_box(self, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
         """
@@ -163,63 +425,45 @@ class SAMInferencer:
         if not self.has_embedding:
             raise RuntimeError("Image not set! Call set_image() first.")
         
-        # Scale coordinates
-        onnx_x1 = x1 * self._scale_factor
-        onnx_y1 = y1 * self._scale_factor
-        onnx_x2 = x2 * self._scale_factor
-        onnx_y2 = y2 * self._scale_factor
-        
         # 2 points for box prompt (top-left and bottom-right corners)
         # Label: 2 = upper-left corner, 3 = lower-right corner
-        box_coords = np.array([
-            [onnx_x1, onnx_y1],
-            [onnx_x2, onnx_y2]
-        ], dtype=np.float32)
-        box_labels = np.array([2, 3], dtype=np.float32)  # 2=top-left, 3=bottom-right
-        
-        # 5 points padding (2 real + 3 dummy)
-        onnx_coord = np.concatenate([
-            box_coords,
-            np.array([[0.0, 0.0]] * 3, dtype=np.float32)
-        ], axis=0)[None, :, :]
-        
-        onnx_label = np.concatenate([
-            box_labels,
-            np.array([-1] * 3, dtype=np.float32)
-        ], axis=0)[None, :]
-        
-        mask_input = np.zeros((1, 1, 256, 256), dtype=np.float32)
-        has_mask_input = np.zeros(1, dtype=np.float32)
-        orig_size = np.array(self._original_size, dtype=np.float32)
-        
-        ort_inputs = {
-            "image_embeddings": self._image_embedding.astype(np.float32),
-            "point_coords": onnx_coord.astype(np.float32),
-            "point_labels": onnx_label.astype(np.float32),
-            "mask_input": mask_input.astype(np.float32),
-            "has_mask_input": has_mask_input.astype(np.float32),
-            "orig_im_size": orig_size.astype(np.float32)
-        }
-        
-        masks, _, _ = self._decoder_session.run(None, ort_inputs)
-        
-        # Create binary mask
-        final_mask = masks[0, 0, :, :]
-        final_mask = (final_mask > 0).astype(np.uint8)
-        
-        # Resize to original size
-        if final_mask.shape[:2] != self._original_size:
-            final_mask = cv2.resize(
-                final_mask, 
-                (self._original_size[1], self._original_size[0]),  # (W, H)
-                interpolation=cv2.INTER_NEAREST
-            )
+        return self._decode(((x1, y1), (x2, y2)), (2, 3))
+    
+    def _decode(self, points, labels) -> np.ndarray:
+        """
+        Run the decoder for a prompt.
+        
+        Args:
+            points: [(x, y), ...] on original image (pixel), at most PROMPT_POINTS
+            labels: Label per point
+            
+        Returns:
+            Binary mask (uint8, 0 or 1), in original image size
+        """
+        count = len(points)
+        
+        # Fill the preallocated prompt buffers (scaled coordinates + padding)
+        self._point_coords[0, :count] = np.multiply(points, self._scale_factor)
+        self._point_coords[0, count:] = 0.0
+        self._point_labels[0, :count] = labels
+        self._point_labels[0, count:] = -1.0
+        
+        self._decoder_session.run_with_iobinding(self._decoder_binding)
+        masks = self._decoder_binding.copy_outputs_to_cpu()[0]
+        
+        # The decoder upsamples to orig_im_size, so no resize is needed
+        logits = masks[0, 0]
+        assert logits.shape == self._original_size, "Decoder mask does not match orig_im_size"
         
-        return final_mask
+        # Binary mask: bool -> uint8 is a view (0/1), no second full-size array
+        return np.greater(logits, 0).view(np.uint8)
     
-    def mask_to_bbox(self, mask: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+    @staticmethod
+    def mask_to_bbox(mask: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
         """
-        Extract bounding box from mask.
+        Extract bounding box of the largest blob in the mask.
+        
+        Stray blobs are ignored, like in mask_to_polygon (largest contour).
         
         Args:
             mask: Binary mask
@@ -227,17 +471,19 @@ class SAMInferencer:
         Returns:
             (x1, y1, x2, y2) or None (if mask is empty)
         """
-        # Find coordinates of white pixels in mask
-        coords = np.where(mask > 0)
-        if len(coords[0]) == 0:
-            return None
+        mask = SAMInferencer._as_binary_u8(mask)
         
-        y1, y2 = coords[0].min(), coords[0].max()
-        x1, x2 = coords[1].min(), coords[1].max()
+        # Bbox + area of every blob in a single C pass (label 0 is the background)
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+        if count <= 1:
+            return None
         
-        return (int(x1), int(y1), int(x2), int(y2))
+        largest = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        x, y, w, h = stats[largest, :4].tolist()
+        return (x, y, x + w - 1, y + h - 1)
     
-    def mask_to_polygon(self, mask: np.ndarray, simplify_epsilon: float = 2.0) -> Optional[List[Tuple[int, int]]]:
+    @staticmethod
+    def mask_to_polygon(mask: np.ndarray, simplify_epsilon: float = 2.0) -> Optional[List[Tuple[int, int]]]:
         """
         Extract polygon points from mask.
         
@@ -248,9 +494,9 @@ class SAMInferencer:
         Returns:
             [(x1, y1), (x2, y2), ...] or None (if mask is empty)
         """
-        # Find contour
+        # Find contour (Teh-Chin approximation: fewer points for approxPolyDP)
         contours, _ = cv2.findContours(
-            mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            SAMInferencer._as_binary_u8(mask), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_TC89_KCOS
         )
         
         if not contours:
@@ -259,23 +505,38 @@ class SAMInferencer:
         # Get largest contour
         largest_contour = max(contours, key=cv2.contourArea)
         
-        # Simplify contour
-        epsilon = simplify_epsilon
-        approx = cv2.approxPolyDP(largest_contour, epsilon, True)
+        # Simplify contour (epsilon <= 0: keep the contour as is)
+        if simplify_epsilon > 0:
+            approx = cv2.approxPolyDP(largest_contour, simplify_epsilon, True)
+        else:
+            approx = largest_contour
         
         # Minimum 3 points required
         if len(approx) < 3:
             return None
         
-        # Convert points to list
-        points = [(int(p[0][0]), int(p[0][1])) for p in approx]
+        # (N, 1, 2) int32 -> [(x, y), ...] with Python ints in one conversion
+        return list(map(tuple, approx.reshape(-1, 2).tolist()))
+    
+    @staticmethod
+    def _as_binary_u8(mask: np.ndarray) -> np.ndarray:
+        """
+        Mask as contiguous uint8 for OpenCV (uint8 masks are used as is).
         
-        return points
+        Other dtypes are thresholded (> 0) and the bool result is viewed as
+        uint8, so only one mask-sized array is allocated.
+        """
+        if mask.dtype == np.uint8 and mask.flags.c_contiguous:
+            return mask
+        return np.greater(mask, 0).view(np.uint8)
     
-    def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
+    def preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """
         Prepare image for encoder.
         
+        Only touches the input tensor (no embedding/prompt state), so it may run
+        on another thread while prompts are decoded; one call at a time.
+        
         Args:
             image: numpy array in BGR format
             
@@ -284,29 +545,34 @@ class SAMInferencer:
         """
         old_h, old_w = image.shape[:2]
         scale = self.INPUT_SIZE * 1.0 / max(old_h, old_w)
-        self._scale_factor = scale
         
         new_h, new_w = int(old_h * scale), int(old_w * scale)
-        resized_image = cv2.resize(image, (new_w, new_h))
-        
-        # ImageNet normalization
-        pixel_mean = np.array([123.675, 116.28, 103.53], dtype=np.float32).reshape(1, 1, 3)
-        pixel_std = np.array([58.395, 57.12, 57.375], dtype=np.float32).reshape(1, 1, 3)
-        
-        x = (resized_image.astype(np.float32) - pixel_mean) / pixel_std
-        
-        # Padding (right and bottom)
-        pad_h = self.INPUT_SIZE - new_h
-        pad_w = self.INPUT_SIZE - new_w
-        x = np.pad(x, ((0, pad_h), (0, pad_w), (0, 0)), mode='constant', constant_values=0)
+        resized_image = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        
+        # Reused input tensor: only the padding (right and bottom of the image)
+        # is zeroed, the image region is overwritten below
+        x = self._input_tensor
+        if x is None:
+            x = self._input_tensor = np.empty(
+                (1, 3, self.INPUT_SIZE, self.INPUT_SIZE), dtype=np.float32
+            )
+        x[0, :, new_h:, :] = 0.0
+        x[0, :, :new_h, new_w:] = 0.0
+        region = x[0, :, :new_h, :new_w]
         
-        # (H, W, C) -> (1, C, H, W)
-        x = x.transpose(2, 0, 1)[None, :, :, :].astype(np.float32)
+        # ImageNet normalization (RGB order), written straight into the padded tensor.
+        # BGR (H, W, C) -> RGB (C, H, W) is a strided view, no copy
+        rgb_chw = resized_image.transpose(2, 0, 1)[::-1]
+        np.subtract(rgb_chw, self.PIXEL_MEAN, out=region)
+        np.multiply(region, self.PIXEL_INV_STD, out=region)
         
         return x
     
     def clear_embedding(self):
         """Clear embedding cache."""
+        self._decoder_binding = None
+        self._decoder_input_values = []
         self._image_embedding = None
+        self._embedding_value = None
         self._original_size = None
         self._scale_factor = 1.0
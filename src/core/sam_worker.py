@@ -5,66 +5,259 @@ QThread based asynchronous SAM operations.
 Encoding and inference are performed in a background thread to prevent UI freezing.
 """
 
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import numpy as np
 
-from PySide6.QtCore import QThread, Signal, QMutex, QMutexLocker
+from PySide6.QtCore import (
+    QThread, Signal, QMutex, QMutexLocker, QWaitCondition, QStandardPaths
+)
 
 from .sam_inferencer import SAMInferencer
 
 
+class EmbeddingDiskCache:
+    """
+    Content-addressed on-disk cache of encoder embeddings.
+    
+    Key: hash of the image pixels + shape + encoder signature, so revisiting an
+    image skips the encoder (the dominant SAM cost) even across sessions, and a
+    different encoder never reuses stale embeddings. One .npy file per image,
+    stored as given (the worker stores FP16; readers cast back to float32).
+    """
+    
+    def __init__(self, directory: Path, max_entries: int = 1000):
+        """
+        Args:
+            directory: Cache folder (created on first write)
+            max_entries: Oldest files are deleted beyond this (~2 MB each in FP16)
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        # Entry count tracked in memory (one directory scan here, not per write).
+        # get/put run on the worker and the background thread: _lock guards it
+        self._lock = threading.Lock()
+        self._count = self._scan_count()
+    
+    def _scan_count(self) -> int:
+        try:
+            with os.scandir(self.directory) as entries:
+                return sum(entry.name.endswith(".npy") for entry in entries)
+        except OSError:
+            return 0
+    
+    @staticmethod
+    def key(image: np.ndarray, encoder_signature: str) -> str:
+        """Cache key of an image for an encoder."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{image.shape}|{image.dtype}|{encoder_signature}".encode())
+        digest.update(memoryview(np.ascontiguousarray(image)).cast("B"))
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npy"
+    
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Cached embedding, None on miss (or unreadable file)."""
+        path = self._path(key)
+        try:
+            return np.load(path, allow_pickle=False)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Truncated/corrupt entry: drop it, it will be re-encoded
+            with self._lock:
+                try:
+                    path.unlink()
+                    self._count -= 1
+                except OSError:
+                    pass
+            return None
+    
+    def put(self, key: str, embedding: np.ndarray):
+        """Store an embedding (best effort: failures only skip caching)."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename: readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, embedding, allow_pickle=False)
+            path = self._path(key)
+            with self._lock:
+                is_new = not path.exists()
+                os.replace(tmp_path, path)
+                if is_new:
+                    self._count += 1
+                    if self._count > self.max_entries:
+                        self._prune()
+        except OSError as e:
+            print(f"Warning: Could not cache SAM embedding: {e}")
+    
+    def _prune(self):
+        """Delete the oldest entries, down to 90% of max_entries (called with _lock held)."""
+        # Prune below the limit so the directory isn't rescanned on every write
+        keep = self.max_entries * 9 // 10
+        with os.scandir(self.directory) as entries:
+            files = [
+                (entry.stat().st_mtime, entry.path) for entry in entries
+                if entry.name.endswith(".npy")
+            ]
+        files.sort()
+        removed = 0
+        for _, path in files[:max(0, len(files) - keep)]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        self._count = len(files) - removed
+
+
 class SAMWorker(QThread):
     """
     SAM operations in background thread.
     
     Signals:
         model_loaded: Models successfully loaded
+        device_selected: Execution provider running the encoder (provider_name)
+        encoder_variant: Encoder model in use (file stem, e.g. the CPU fallback's)
+        warmup_finished: Sessions warmed up with a dummy run (first encode/click is fast)
+        encoder_bytes_saved: Model size saved by the reduced precision encoder (bytes)
         model_load_failed: Model loading error (error_message)
         encoding_started: Image encoding started
         encoding_finished: Image encoding finished
         inference_started: Inference started
         mask_ready: Mask ready (mask, mode, x, y)
+        shape_ready: Shape derived from the mask on the worker thread
+            (bbox (x1, y1, x2, y2) / polygon [(x, y), ...] / None, mode, x, y)
         error_occurred: Error occurred (error_message)
     """
     
     # Signals
     model_loaded = Signal()
+    device_selected = Signal(str)
+    encoder_variant = Signal(str)
+    warmup_finished = Signal()
+    encoder_bytes_saved = Signal(int)
     model_load_failed = Signal(str)
     encoding_started = Signal()
     encoding_finished = Signal()
     inference_started = Signal()
     mask_ready = Signal(object, str, int, int)  # (mask, mode, x, y)
+    shape_ready = Signal(object, str, int, int)  # (bbox | points | None, mode, x, y)
     error_occurred = Signal(str)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Only the worker thread uses the inferencer (clear_embedding is queued too),
+        # so model runs need no lock
         self._inferencer: Optional[SAMInferencer] = None
-        self._mutex = QMutex()
         
-        # Task queue
-        self._task = None  # ("load", paths) | ("encode", image) | ("infer", x, y, mode)
+        # Inferencer state mirrored as plain bools (written by the worker thread
+        # after each operation), so the UI can poll it without touching the inferencer
+        self._models_loaded = False
+        self._embedding_ready = False
+        
+        # Embeddings of encoded images, reused when an image is opened again
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        self._embedding_cache = EmbeddingDiskCache(Path(cache_root) / "sam_embeddings")
+        self._encoder_signature = ""  # Set when models are loaded
+        self._embedding_key: Optional[str] = None  # Cache key of the current embedding
+        # Recent embeddings in memory {cache key: FP16 embedding}, LRU order
+        self._recent_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._recent_embeddings_size = 16
+        # Encoder preprocessing and cache writes, off the worker thread's critical
+        # path (OpenCV, hashlib and file I/O release the GIL). One thread: the
+        # preprocessed tensor buffer is reused, so calls must not overlap
+        self._background = ThreadPoolExecutor(max_workers=1)
+        
+        # Task queue: ("load",) | ("encode", image) | ("infer", x, y, mode)
+        # | ("infer_box", x1, y1, x2, y2, mode) | ("clear",).
+        # Its lock is only held briefly, so requests never wait for a running
+        # encode/inference
+        self._tasks = deque()
+        self._queue_mutex = QMutex()
+        self._queue_condition = QWaitCondition()
         self._running = True
+        # Kind of the task in progress, and whether a newer request replaced it
+        # (its result is stale then and is not emitted)
+        self._current_kind: Optional[str] = None
+        self._current_superseded = False
         
-    def set_model_paths(self, encoder_path: str, decoder_path: str):
-        """Set model paths."""
-        with QMutexLocker(self._mutex):
-            self._inferencer = SAMInferencer(encoder_path, decoder_path)
+    def set_model_paths(self, encoder_path: str, decoder_path: str, device: str = "auto",
+                        fp16_encoder: bool = False, mobile_encoder_path: Optional[str] = None):
+        """
+        Set model paths (before request_load_models; the worker picks the new
+        inferencer up with the next task).
+        
+        Args:
+            device: "auto", "cuda" or "cpu" (see SAMInferencer)
+            fp16_encoder: FP16 encoder on GPU providers (see SAMInferencer)
+            mobile_encoder_path: Distilled encoder used when running on CPU only
+                (SAMInferencer cpu_encoder_path)
+        """
+        self._models_loaded = False
+        self._embedding_ready = False
+        self._inferencer = SAMInferencer(
+            encoder_path, decoder_path, device=device, use_fp16=fp16_encoder,
+            cpu_encoder_path=mobile_encoder_path
+        )
+    
+    def _enqueue(self, task: tuple, replaces: tuple = ()):
+        """
+        Queue a task and wake the worker thread.
+        
+        Args:
+            task: Task tuple, kind first
+            replaces: Kinds of pending tasks the new task makes obsolete
+        """
+        with QMutexLocker(self._queue_mutex):
+            tasks = self._tasks
+            if replaces and tasks:
+                if tasks[-1][0] in replaces and len(tasks) == 1:
+                    tasks.pop()  # Common case: only the previous click is pending
+                else:
+                    self._tasks = deque(t for t in tasks if t[0] not in replaces)
+            if self._current_kind in replaces:
+                self._current_superseded = True
+                if self._current_kind == "encode" and self._inferencer is not None:
+                    # A newer image: stop encoding the old one right away
+                    self._inferencer.cancel_encode()
+            self._tasks.append(task)
+            self._queue_condition.wakeOne()
     
     def request_load_models(self):
         """Request model loading (async)."""
-        with QMutexLocker(self._mutex):
-            self._task = ("load",)
-        if not self.isRunning():
-            self.start()
-    
-    def request_encode_image(self, image: np.ndarray):
-        """Request image encoding (async)."""
-        with QMutexLocker(self._mutex):
-            self._task = ("encode", image.copy())
-        if not self.isRunning():
-            self.start()
+        self._enqueue(("load",), replaces=("load",))
+    
+    def request_encode_image(self, image: np.ndarray, take_ownership: bool = False):
+        """
+        Request image encoding (async).
+        
+        Args:
+            image: BGR image
+            take_ownership: The caller hands the array over and won't modify it
+                afterwards, so it is queued without a copy (and made read-only,
+                accidental writes raise). Otherwise a copy is queued (the caller
+                may keep using its array)
+        """
+        if take_ownership:
+            image = np.ascontiguousarray(image)
+            image.setflags(write=False)
+        else:
+            image = image.copy()
+        # Pending clicks belong to the previous image
+        self._enqueue(("encode", image), replaces=("encode", "infer", "infer_box"))
+    
+    # A new click/box replaces a pending (not yet started) one: only the latest is inferred
+    _INFER_KINDS = ("infer", "infer_box")
     
     def request_infer_point(self, x: int, y: int, mode: str):
         """
@@ -74,10 +267,7 @@ class SAMWorker(QThread):
             x, y: Clicked coordinates
             mode: "bbox" or "polygon"
         """
-        with QMutexLocker(self._mutex):
-            self._task = ("infer", x, y, mode)
-        if not self.isRunning():
-            self.start()
+        self._enqueue(("infer", x, y, mode), replaces=self._INFER_KINDS)
     
     def request_infer_box(self, x1: int, y1: int, x2: int, y2: int, mode: str = "polygon"):
         """
@@ -88,88 +278,142 @@ class SAMWorker(QThread):
             x2, y2: Bottom-right corner
             mode: 'bbox' or 'polygon' - result type
         """
-        with QMutexLocker(self._mutex):
-            self._task = ("infer_box", x1, y1, x2, y2, mode)
-        if not self.isRunning():
-            self.start()
+        self._enqueue(("infer_box", x1, y1, x2, y2, mode), replaces=self._INFER_KINDS)
     
     @property
     def is_ready(self) -> bool:
-        """Are models loaded and embedding ready?"""
-        with QMutexLocker(self._mutex):
-            if self._inferencer is None:
-                return False
-            return self._inferencer.is_loaded and self._inferencer.has_embedding
+        """Are models loaded and embedding ready? (lock-free)"""
+        return self._models_loaded and self._embedding_ready
     
     @property
     def is_model_loaded(self) -> bool:
-        """Are models loaded?"""
-        with QMutexLocker(self._mutex):
-            if self._inferencer is None:
-                return False
-            return self._inferencer.is_loaded
+        """Are models loaded? (lock-free)"""
+        return self._models_loaded
     
     def run(self):
-        """Thread main loop."""
-        while self._running:
-            task = None
-            
-            with QMutexLocker(self._mutex):
-                if self._task is not None:
-                    task = self._task
-                    self._task = None
-            
-            if task is None:
-                # Stop thread if no task
-                break
+        """Thread main loop (sleeps until a task is queued or stop() is called)."""
+        while True:
+            with QMutexLocker(self._queue_mutex):
+                while not self._tasks and self._running:
+                    self._queue_condition.wait(self._queue_mutex)
+                if not self._running:
+                    break
+                task = self._tasks.popleft()
+                self._current_kind = task[0]
+                self._current_superseded = False
             
             try:
                 if task[0] == "load":
                     self._do_load_models()
                 elif task[0] == "encode":
                     self._do_encode_image(task[1])
+                elif task[0] == "clear":
+                    self._do_clear_embedding()
                 elif task[0] == "infer":
                     self._do_infer_point(task[1], task[2], task[3])
                 elif task[0] == "infer_box":
                     self._do_infer_box(task[1], task[2], task[3], task[4], task[5])
             except Exception as e:
                 self.error_occurred.emit(str(e))
+            finally:
+                with QMutexLocker(self._queue_mutex):
+                    self._current_kind = None
+    
+    def _is_superseded(self) -> bool:
+        """Has a newer request replaced the task in progress?"""
+        with QMutexLocker(self._queue_mutex):
+            return self._current_superseded
     
     def _do_load_models(self):
         """Model loading operation."""
         try:
-            with QMutexLocker(self._mutex):
-                if self._inferencer is None:
-                    self.model_load_failed.emit("Inferencer not set!")
-                    return
-                self._inferencer.load_models()
+            inferencer = self._inferencer
+            if inferencer is None:
+                self.model_load_failed.emit("Inferencer not set!")
+                return
+            inferencer.load_models(warmup=False)
+            self._encoder_signature = inferencer.encoder_signature
+            provider = inferencer.active_provider
+            bytes_saved = inferencer.encoder_bytes_saved
+            self.device_selected.emit(provider)
+            self.encoder_variant.emit(inferencer.encoder_path.stem)
+            if bytes_saved:
+                self.encoder_bytes_saved.emit(bytes_saved)
+            
+            # Pay kernel selection / arena allocation / CUDA init now, before the
+            # SAM tools are enabled, not on the user's first click
+            inferencer.encoder_warmup()
+            self._models_loaded = True
+            self.warmup_finished.emit()
             self.model_loaded.emit()
         except Exception as e:
+            self._models_loaded = False
             self.model_load_failed.emit(str(e))
     
     def _do_encode_image(self, image: np.ndarray):
         """Image encoding operation."""
         self.encoding_started.emit()
         try:
-            with QMutexLocker(self._mutex):
-                if self._inferencer is None or not self._inferencer.is_loaded:
-                    self.error_occurred.emit("Models not loaded!")
-                    return
-                self._inferencer.set_image(image)
+            inferencer = self._inferencer
+            if inferencer is None or not inferencer.is_loaded:
+                self.error_occurred.emit("Models not loaded!")
+                return
+            
+            # Preprocess in the background while the image is hashed and looked up
+            # (wasted only on a cache hit)
+            prepared = self._background.submit(inferencer.preprocess_image, image)
+            
+            # Recent images in memory first, then the disk cache
+            key = self._embedding_cache.key(image, self._encoder_signature)
+            if key == self._embedding_key and inferencer.has_embedding:
+                # Same pixels as the current embedding (e.g. image re-opened)
+                self._embedding_ready = True
+                self.encoding_finished.emit()
+                return
+            cached = self._recent_embeddings.get(key)
+            in_memory = cached is not None
+            if in_memory:
+                self._recent_embeddings.move_to_end(key)
+            else:
+                cached = self._embedding_cache.get(key)
+            
+            if cached is None and self._is_superseded():
+                return  # A newer image is queued: don't start the encoder
+            try:
+                if cached is not None:
+                    inferencer.set_precomputed_embedding(cached, image.shape[:2])
+                else:
+                    inferencer.set_image(image, input_tensor=prepared.result())
+            finally:
+                self._embedding_ready = inferencer.has_embedding
+            self._embedding_key = key
+            
+            # Caches hold FP16 (half the memory/disk per entry, twice the entries;
+            # the decoder is insensitive to it). Cast back to float32 on reuse
+            if cached is None:
+                cached = inferencer.embedding.astype(np.float16)
+                self._background.submit(self._embedding_cache.put, key, cached)
+            if not in_memory:
+                self._recent_embeddings[key] = cached
+                if len(self._recent_embeddings) > self._recent_embeddings_size:
+                    self._recent_embeddings.popitem(last=False)
             self.encoding_finished.emit()
         except Exception as e:
+            if self._is_superseded():
+                return  # Cancelled for a newer image (cancel_encode)
             self.error_occurred.emit(f"Encoding error: {e}")
     
     def _do_infer_point(self, x: int, y: int, mode: str):
         """Point inference operation."""
         self.inference_started.emit()
         try:
-            with QMutexLocker(self._mutex):
-                if self._inferencer is None or not self._inferencer.has_embedding:
-                    self.error_occurred.emit("Image encoding not done!")
-                    return
-                mask = self._inferencer.infer_point(x, y)
-            self.mask_ready.emit(mask, mode, x, y)
+            inferencer = self._inferencer
+            if inferencer is None or not inferencer.has_embedding:
+                self.error_occurred.emit("Image encoding not done!")
+                return
+            mask = inferencer.infer_point(x, y)
+            if not self._is_superseded():  # A newer click is queued: drop this mask
+                self._emit_result(mask, mode, x, y)
         except Exception as e:
             self.error_occurred.emit(f"Inference error: {e}")
     
@@ -177,37 +421,67 @@ class SAMWorker(QThread):
         """Box inference operation."""
         self.inference_started.emit()
         try:
-            with QMutexLocker(self._mutex):
-                if self._inferencer is None or not self._inferencer.has_embedding:
-                    self.error_occurred.emit("Image encoding not done!")
-                    return
-                mask = self._inferencer.infer_box(x1, y1, x2, y2)
-            # Return result as bbox or polygon based on mode
-            self.mask_ready.emit(mask, mode, x1, y1)
+            inferencer = self._inferencer
+            if inferencer is None or not inferencer.has_embedding:
+                self.error_occurred.emit("Image encoding not done!")
+                return
+            mask = inferencer.infer_box(x1, y1, x2, y2)
+            # Return result as bbox or polygon based on mode (unless already stale)
+            if not self._is_superseded():
+                self._emit_result(mask, mode, x1, y1)
         except Exception as e:
             self.error_occurred.emit(f"Box inference error: {e}")
     
+    def _emit_result(self, mask: np.ndarray, mode: str, x: int, y: int):
+        """
+        Emit a mask and the shape derived from it for the mode.
+        
+        The bbox/polygon is extracted here on the worker thread, so UI consumers
+        that only need the shape never scan the full-size mask.
+        """
+        if mode == "bbox":
+            shape = SAMInferencer.mask_to_bbox(mask)
+        elif mode == "polygon":
+            shape = SAMInferencer.mask_to_polygon(mask)
+        else:
+            shape = None
+        self.mask_ready.emit(mask, mode, x, y)
+        self.shape_ready.emit(shape, mode, x, y)
+    
     def get_bbox_from_mask(self, mask: np.ndarray):
-        """Extract bbox from mask (can be called from main thread)."""
-        with QMutexLocker(self._mutex):
-            if self._inferencer is not None:
-                return self._inferencer.mask_to_bbox(mask)
-        return None
+        """
+        Extract bbox from mask (can be called from main thread).
+        
+        Pure function of the mask: no lock, so it never waits for a running
+        encode/inference.
+        """
+        return SAMInferencer.mask_to_bbox(mask)
     
     def get_polygon_from_mask(self, mask: np.ndarray):
-        """Extract polygon from mask (can be called from main thread)."""
-        with QMutexLocker(self._mutex):
-            if self._inferencer is not None:
-                return self._inferencer.mask_to_polygon(mask)
-        return None
+        """Extract polygon from mask (can be called from main thread, no lock)."""
+        return SAMInferencer.mask_to_polygon(mask)
     
     def stop(self):
-        """Stop thread."""
-        self._running = False
+        """Stop thread (after the task in progress, pending tasks are dropped)."""
+        with QMutexLocker(self._queue_mutex):
+            self._running = False
+            self._tasks.clear()
+            self._queue_condition.wakeAll()
+            if self._current_kind == "encode" and self._inferencer is not None:
+                # Don't wait for a full encode on exit (and don't report it as an error)
+                self._current_superseded = True
+                self._inferencer.cancel_encode()
         self.wait()
+        self._background.shutdown(wait=True)  # Finish pending cache writes
     
     def clear_embedding(self):
-        """Clear embedding cache."""
-        with QMutexLocker(self._mutex):
-            if self._inferencer is not None:
-                self._inferencer.clear_embedding()
+        """Clear embedding cache (queued: runs on the worker thread, pending clicks dropped)."""
+        self._embedding_ready = False
+        self._enqueue(("clear",), replaces=self._INFER_KINDS)
+    
+    def _do_clear_embedding(self):
+        """Embedding clearing operation."""
+        if self._inferencer is not None:
+            self._inferencer.clear_embedding()
+        self._embedding_ready = False
+        self._embedding_key = None
@@ -239,124 +239,124 @@ Devam etmek istiyor musunuz?</translation>
 <context>
     <name>ExportWizard</name>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="828" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="842" />
         <source>Export Wizard</source>
         <translation>Dışa Aktarma Sihirbazı</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="869" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="883" />
         <source>← Back</source>
         <translation>← Geri</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="875" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="889" />
         <source>Cancel</source>
         <translation>İptal</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="879" />
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1419" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="893" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1440" />
         <source>Next →</source>
         <translation>İleri →</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="894" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="908" />
         <source>Enable Dataset Split</source>
         <translation>Veri Seti Bölmeyi Etkinleştir</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="916" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="930" />
         <source>Shuffle Settings</source>
         <translation>Karıştırma Ayarları</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="919" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="933" />
         <source>Shuffle Data</source>
         <translation>Verileri Karıştır</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="936" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="950" />
         <source>Unlabeled Files</source>
         <translation>Etiketsiz Dosyalar</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="939" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="953" />
         <source>Include unlabeled images</source>
         <translation>Etiketsiz görselleri dahil et</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="941" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="955" />
         <source>If disabled, only labeled files will be exported</source>
         <translation>Devre dışı bırakılırsa, yalnızca etiketli dosyalar export edilir</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="973" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="987" />
         <source>Enable Augmentation</source>
         <translation>Augmentation Etkinleştir</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="978" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="992" />
         <source>Multiplier:</source>
         <translation>Çarpan:</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="993" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1007" />
         <source>Resize</source>
         <translation>Yeniden Boyutlandır</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="996" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1010" />
         <source>Enable Resize</source>
         <translation>Yeniden Boyutlandırmayı Etkinleştir</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1000" />
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1191" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1014" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1205" />
         <source>Size:</source>
         <translation>Boyut:</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1014" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1028" />
         <source>Mode:</source>
         <translation>Mod:</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1025" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1039" />
         <source>Augmentation Parameters</source>
         <translation>Augmentation Parametreleri</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1029" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1043" />
         <source>Brightness</source>
         <translation>Parlaklık</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1041" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1055" />
         <source>Value:</source>
         <translation>Değer:</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1053" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1067" />
         <source>Brighten</source>
         <translation>Aydınlat</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1054" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1068" />
         <source>Darken</source>
         <translation>Karart</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1063" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1077" />
         <source>Contrast</source>
         <translation>Kontrast</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1073" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1087" />
         <source>Rotation</source>
         <translation>Döndürme</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1074" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1088" />
         <source>Rotation: Rotates the image at random angles.
 
 • 0°: No rotation
@@ -373,39 +373,39 @@ Teaches recognition of objects from different angles.</source>
 Farklı açılardan nesne tanımayı öğretir.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1083" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1097" />
         <source>Flip</source>
         <translation>Çevir</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1101" />
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1234" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1115" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1248" />
         <source>Horizontal:</source>
         <translation>Yatay:</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1107" />
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1240" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1121" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1254" />
         <source>Vertical:</source>
         <translation>Dikey:</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1112" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1126" />
         <source>Blur</source>
         <translation>Bulanıklık</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1120" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1134" />
         <source>Noise</source>
         <translation>Gürültü</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1129" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1143" />
         <source>Hue</source>
         <translation>Renk Tonu</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1130" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1144" />
         <source>Hue: Shifts colors in the color spectrum.
 
 Adapts to different lighting color temperatures.</source>
@@ -414,12 +414,12 @@ Adapts to different lighting color temperatures.</source>
 Farklı aydınlatma renk sıcaklıklarına uyum sağlar.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1136" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1150" />
         <source>Grayscale</source>
         <translation>Gri Tonlama</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1138" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1152" />
         <source>Grayscale: Converts the image to black and white.
 
 • Rate %: Percentage of images to convert to grayscale
@@ -432,58 +432,58 @@ Teaches object recognition without color information.</source>
 Renk bilgisi olmadan nesne tanımayı öğretir.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1152" />
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1202" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1166" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1216" />
         <source>Rate:</source>
         <translation>Oran:</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1158" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1172" />
         <source>Exposure</source>
         <translation>Pozlama</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1168" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1182" />
         <source>Cutout</source>
         <translation>Cutout</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1196" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1210" />
         <source>Count:</source>
         <translation>Adet:</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1208" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1222" />
         <source>Motion Blur</source>
         <translation>Hareket Bulanıklığı</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1216" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1230" />
         <source>Shear</source>
         <translation>Kesme</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="843" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="857" />
         <source>Step 1/3: Dataset Split</source>
         <translation>Adım 1/3: Veri Seti Bölme</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="890" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="904" />
         <source>📊 Total {} images</source>
         <translation>📊 Toplam {} görsel</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="900" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="914" />
         <source>Split Ratios (drag to adjust)</source>
         <translation>Bölme Oranları (sürükleyerek ayarlayın)</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="948" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="962" />
         <source>📊 {} labeled, {} unlabeled files</source>
         <translation>📊 {} etiketli, {} etiketsiz dosya</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1031" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1045" />
         <source>Brightness: Adjusts the light/dark level of the image.
 
 • Brighten: Lightens the image
@@ -500,7 +500,7 @@ Used for generalization under different lighting conditions.</source>
 Farklı aydınlatma koşullarında genelleme için kullanılır.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1064" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1078" />
         <source>Contrast: Adjusts the difference between light and dark tones.
 
 • 100%: Original contrast
@@ -517,7 +517,7 @@ Used for generalization under different lighting conditions.</source>
 Farklı aydınlatma koşullarında genelleme için kullanılır.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1085" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1099" />
         <source>Flip: Mirrors the image.
 
 • Horizontal: Left-right mirroring
@@ -534,7 +534,7 @@ Provides generalization for symmetric objects and different viewing angles.</sou
 Simetrik nesneler ve farklı görüş açıları için genelleme sağlar.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1113" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1127" />
         <source>Blur: Adds Gaussian blur to the image.
 
 Unit: Kernel size (pixels)
@@ -547,7 +547,7 @@ Birim: Kernel boyutu (piksel)
 Odak dışı veya hareketli nesnelerin işlenmesini öğretir.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1121" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1135" />
         <source>Noise: Adds random pixel noise to the image.
 
 Unit: Standard deviation (sigma)
@@ -562,7 +562,7 @@ Piksel değerlerine ±sigma rastgele değerler eklenir.
 Düşük kaliteli veya gürültülü kamera sensörleri için genelleme sağlar.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1159" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1173" />
         <source>Exposure (Gamma): Adjusts light exposure.
 
 • 100%: Original
@@ -579,7 +579,7 @@ Unlike brightness, preserves color tones.</source>
 Parlaklığın aksine renk tonlarını korur.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1170" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1184" />
         <source>Cutout: Adds random black squares to the image.
 
 Unit: Percentage of image size
@@ -610,7 +610,7 @@ Bunu hem burada hem de eğitim sırasında uygulamak (çift uygulama)
 model performansını olumsuz etkileyebilir.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1209" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1223" />
         <source>Motion Blur: Adds horizontal motion effect.
 
 Unit: Kernel size (pixels)
@@ -623,7 +623,7 @@ Birim: Kernel boyutu (piksel)
 Hareketli nesnelerin algılanmasını öğretir.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1218" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1232" />
         <source>Shear: Tilts the image horizontally/vertically.
 
 • Horizontal: Horizontal tilt angle
@@ -640,82 +640,92 @@ Perspektif çeşitliliği sağlar,
 farklı görüş açılarından genelleme öğretir.</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1253" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1267" />
         <source>Live Preview</source>
         <translation>Canlı Önizleme</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1256" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1270" />
         <source>Enable augmentation</source>
         <translation>Augmentation etkinleştir</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1271" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1285" />
         <source>Export Format</source>
         <translation>Export Formatı</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1307" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1321" />
         <source>Type:</source>
         <translation>Tip:</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1321" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1335" />
+        <source>Only write non-empty label files</source>
+        <translation>Sadece boş olmayan etiket dosyalarını yaz</translation>
+    </message>
+    <message>
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1337" />
+        <source>Unlabeled images get no .txt file instead of an empty one</source>
+        <translation>Etiketsiz görseller için boş .txt yerine dosya oluşturulmaz</translation>
+    </message>
+    <message>
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1341" />
         <source>Output Folder</source>
         <translation>Çıkış Klasörü</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1327" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1347" />
         <source>Select output folder...</source>
         <translation>Çıkış klasörü seçin...</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1330" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1350" />
         <source>📁 Browse...</source>
         <translation>📁 Gözat...</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1410" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1431" />
         <source>Dataset Split</source>
         <translation>Veri Seti Bölme</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1410" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1431" />
         <source>Augmentation</source>
         <translation>Augmentation</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1410" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1431" />
         <source>Format &amp; Export</source>
         <translation>Format ve Dışa Aktarma</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1411" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1432" />
         <source>Step {}/3: {}</source>
         <translation>Adım {}/3: {}</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1445" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1466" />
         <source>📂 Train: {} images | Val: {} images | Test: {} images</source>
         <translation>📂 Train: {} görsel | Val: {} görsel | Test: {} görsel</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1463" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1484" />
         <source>{}x → {} images (1 original + {} augmented)</source>
         <translation>{}x → {} görsel (1 orijinal + {} augmented)</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1574" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1600" />
         <source>📊 Total {} images to export</source>
         <translation>📊 Toplam {} görsel dışa aktarılacak</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1772" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1804" />
         <source>Exporting: {}/{}</source>
         <translation>Export ediliyor: {}/{}</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1776" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1808" />
         <source>✓ {} images exported.
 
 Location: {}</source>
@@ -724,39 +734,39 @@ Location: {}</source>
 Konum: {}</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1783" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1815" />
         <source>Export error:
 {}</source>
         <translation>Export hatası:
 {}</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1416" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1437" />
         <source>📦 Export</source>
         <translation>📦 Dışa Aktar</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1437" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1458" />
         <source>Split disabled - {} images to single folder</source>
         <translation>Split devre dışı - {} görsel tek klasöre yazılacak</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1558" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1584" />
         <source>Select Export Folder</source>
         <translation>Çıktı Klasörü Seç</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1746" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1777" />
         <source>Starting export...</source>
         <translation>Export başlatılıyor...</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1776" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1808" />
         <source>Success</source>
         <translation>Başarılı</translation>
     </message>
     <message>
-        <location filename="../ui/dialogs/export_dialog_v2.py" line="1783" />
+        <location filename="../ui/dialogs/export_dialog_v2.py" line="1815" />
         <source>Error</source>
         <translation>Hata</translation>
     </message>
@@ -1140,17 +1150,17 @@ Bu işlem geri alınamaz!</translation>
         <translation>Kaydedilmemiş değişiklikler var. Kaydetmeden çıkmak istiyor musunuz?</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1556" />
+        <location filename="../app.py" line="1571" />
         <source>❌ SAM model error: {}</source>
         <translation>❌ SAM model hatası: {}</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1570" />
+        <location filename="../app.py" line="1585" />
         <source>❌ SAM error: {}</source>
         <translation>❌ SAM hatası: {}</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1707" />
+        <location filename="../app.py" line="1720" />
         <source>❌ Could not read image: {}</source>
         <translation>❌ Görsel okunamadı: {}</translation>
     </message>
@@ -1240,53 +1250,53 @@ Bu işlem geri alınamaz!</translation>
         <translation>Kaydedilmemiş Değişiklikler</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1518" />
-        <location filename="../app.py" line="1530" />
+        <location filename="../app.py" line="1525" />
+        <location filename="../app.py" line="1537" />
         <source>⏳ SAM model is loading, please wait...</source>
         <translation>⏳ SAM modeli yükleniyor, lütfen bekleyin...</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1542" />
+        <location filename="../app.py" line="1549" />
         <source>🤖 AI mode enabled - Click on an object</source>
         <translation>🤖 AI modu aktif - Bir nesneye tıklayın</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1546" />
+        <location filename="../app.py" line="1553" />
         <source>🤖 AI mode disabled</source>
         <translation>🤖 AI modu devre dışı</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1551" />
+        <location filename="../app.py" line="1560" />
         <source>✓ SAM model loaded - Press T to enable AI</source>
         <translation>✓ SAM modeli yüklendi - AI'yı açmak için T'ye basın</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1560" />
+        <location filename="../app.py" line="1575" />
         <source>⏳ Analyzing...</source>
         <translation>⏳ Analiz ediliyor...</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1564" />
+        <location filename="../app.py" line="1579" />
         <source>✓ Ready</source>
         <translation>✓ Hazır</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1565" />
+        <location filename="../app.py" line="1580" />
         <source>🤖 AI ready - Click on an object</source>
         <translation>🤖 AI hazır - Bir nesneye tıklayın</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1579" />
+        <location filename="../app.py" line="1594" />
         <source>⏳ Please wait, analyzing image...</source>
         <translation>⏳ Lütfen bekleyin, görsel analiz ediliyor...</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1582" />
+        <location filename="../app.py" line="1597" />
         <source>🔍 AI segmentation in progress... ({}, {})</source>
         <translation>🔍 AI segmentasyonu devam ediyor... ({}, {})</translation>
     </message>
     <message>
-        <location filename="../app.py" line="1686" />
+        <location filename="../app.py" line="1699" />
         <source>✓ AI Polygon created - Select class</source>
         <translation>✓ AI Polygon oluşturuldu - Sınıf seçin</translation>
     </message>
@@ -142,6 +142,8 @@ translations = {
     'Browse': 'Gözat',
     '📁 Browse...': '📁 Gözat...',
     'Select output folder...': 'Çıkış klasörü seçin...',
+    'Only write non-empty label files': 'Sadece boş olmayan etiket dosyalarını yaz',
+    'Unlabeled images get no .txt file instead of an empty one': 'Etiketsiz görseller için boş .txt yerine dosya oluşturulmaz',
     'Select Output Folder': 'Çıkış Klasörünü Seçin',
     'Format & Export': 'Format ve Dışa Aktarma',
     'Format & Export': 'Format ve Dışa Aktarma',
@@ -484,37 +486,32 @@ def translate_ts_file(ts_path):
     translated_count = 0
     unfinished_count = 0
     
-    for context in root.findall('context'):
-        for message in context.findall('message'):
-            source = message.find('source')
-            translation = message.find('translation')
+    # Single pass over all messages (context/message)
+    for message in root.iter('message'):
+        source = message.find('source')
+        translation = message.find('translation')
+        
+        if source is not None and translation is not None:
+            source_text = source.text if source.text else ''
             
-            if source is not None and translation is not None:
-                source_text = source.text if source.text else ''
-                source_normalized = source_text.replace('\r\n', '\n').replace('\r', '\n')
-                
-                # Check single-line dictionary
-                if source_text in translations:
-                    translation.text = translations[source_text]
-                    if 'type' in translation.attrib:
-                        del translation.attrib['type']
-                    translated_count += 1
+            # Check single-line dictionary
+            text = translations.get(source_text)
+            if text is None:
                 # Check multiline translations
-                elif source_normalized in multiline_translations:
-                    translation.text = multiline_translations[source_normalized]
-                    if 'type' in translation.attrib:
-                        del translation.attrib['type']
-                    translated_count += 1
-                elif translation.attrib.get('type') == 'unfinished':
-                    unfinished_count += 1
-    
-    tree.write(ts_path, encoding='utf-8', xml_declaration=True)
-    
-    with open(ts_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    content = content.replace("<?xml version='1.0' encoding='utf-8'?>", 
-                              '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE TS>')
+                source_normalized = source_text.replace('\r\n', '\n').replace('\r', '\n')
+                text = multiline_translations.get(source_normalized)
+            
+            if text is not None:
+                translation.text = text
+                translation.attrib.pop('type', None)
+                translated_count += 1
+            elif translation.attrib.get('type') == 'unfinished':
+                unfinished_count += 1
+    
+    # Serialize once with Qt's header (instead of write + read back + rewrite)
+    content = ET.tostring(root, encoding='unicode')
     with open(ts_path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE TS>\n')
         f.write(content)
     
     print(f"Translation complete!")
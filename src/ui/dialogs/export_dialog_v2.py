@@ -5,6 +5,8 @@ Step-by-step export wizard - Dataset Split → Augmentation → Format
 """
 
 from pathlib import Path
+import shutil
+import tempfile
 import cv2
 import numpy as np
 from PySide6.QtWidgets import (
@@ -20,7 +22,7 @@ from PySide6.QtGui import QFont, QPixmap, QImage, QPainter, QColor, QPen
 from core.class_manager import ClassManager
 from core.annotation_manager import AnnotationManager
 from core.exporter import (
-    YOLOExporter, COCOExporter, CustomTXTExporter, CustomJSONExporter
+    YOLOExporter, COCOExporter, CustomTXTExporter, CustomJSONExporter, dumps_json
 )
 from core.augmentor import (
     Augmentor, AugmentationConfig, ResizeConfig, ResizeMode
@@ -162,7 +164,8 @@ class ExportWorkerV2(QThread):
     error = Signal(str)
     
     def __init__(self, exporter, annotations_dict, output_dir, image_files,
-                 augmentation_config=None, split_config=None, export_format="yolo"):
+                 augmentation_config=None, split_config=None, export_format="yolo",
+                 skip_empty_labels=False):
         super().__init__()
         self.exporter = exporter
         self.annotations_dict = annotations_dict
@@ -171,6 +174,7 @@ class ExportWorkerV2(QThread):
         self.aug_config = augmentation_config
         self.split_config = split_config
         self.export_format = export_format  # "yolo", "coco", "voc"
+        self.skip_empty_labels = skip_empty_labels  # No empty .txt for unlabeled images
         self.augmentor = Augmentor()
         self.splitter = DatasetSplitter()
     
@@ -214,11 +218,14 @@ class ExportWorkerV2(QThread):
                 if self.export_format != "coco":
                     labels_dir.mkdir(parents=True, exist_ok=True)
                 
-                # Create data structure per split for COCO
+                # Create data structure per split for COCO: image entries and annotations
+                # are serialized as they are produced and spooled to temporary files
                 if self.export_format == "coco":
                     self._coco_data[split_name] = {
-                        "images": [],
-                        "annotations": [],
+                        "images": tempfile.TemporaryFile(),
+                        "annotations": tempfile.TemporaryFile(),
+                        "image_count": 0,
+                        "annotation_count": 0,
                         "categories": [
                             {"id": cls.id + 1, "name": cls.name, "supercategory": "none"}  # COCO IDs start from 1
                             for cls in self.exporter.class_manager.classes
@@ -269,7 +276,7 @@ class ExportWorkerV2(QThread):
                 if self.aug_config and self.aug_config.resize.enabled:
                     aug_img, resize_info = self.augmentor.resize_image(aug_img, self.aug_config.resize)
                 else:
-                    resize_info = {}
+                    resize_info = None
                 
                 # Roboflow style naming
                 orig_filename = image_path.name  # e.g: asd9.jpg
@@ -318,7 +325,7 @@ class ExportWorkerV2(QThread):
                         )
                     elif self.export_format == "voc":
                         pass  # No need to generate XML for empty annotation
-                    else:
+                    elif not self.skip_empty_labels:
                         (labels_dir / f"{new_name}.txt").touch()
                 
                 with self._lock:
@@ -331,166 +338,187 @@ class ExportWorkerV2(QThread):
     
     def _add_coco_annotation(self, annotations, transform, resize_info,
                               split_name, image_filename, orig_w, orig_h, new_w, new_h):
-        """Add annotation in COCO format (thread-safe)."""
+        """
+        Add annotation in COCO format (thread-safe).
+        
+        Records are built without holding the lock; IDs are assigned and the
+        serialized records appended to the split's spool files under the lock.
+        """
+        records = []
+        if annotations is not None:
+            records = self._build_coco_records(
+                annotations, transform, resize_info, orig_w, orig_h, new_w, new_h
+            )
+        
         with self._lock:
             coco_data = self._coco_data[split_name]
             
             # Image ID (based on current image count)
-            image_id = len(coco_data["images"]) + 1
+            coco_data["image_count"] += 1
+            image_id = coco_data["image_count"]
             
             # Add image entry
-            coco_data["images"].append({
+            images_file = coco_data["images"]
+            if image_id > 1:
+                images_file.write(b",")
+            images_file.write(dumps_json({
                 "id": image_id,
                 "file_name": image_filename,
                 "width": new_w,
                 "height": new_h
-            })
+            }))
             
-            if annotations is None:
-                return
+            # Annotation IDs (based on current annotation count)
+            annotations_file = coco_data["annotations"]
+            for record in records:
+                coco_data["annotation_count"] += 1
+                record["id"] = coco_data["annotation_count"]
+                record["image_id"] = image_id
+                if record["id"] > 1:
+                    annotations_file.write(b",")
+                annotations_file.write(dumps_json(record))
+    
+    def _build_coco_records(self, annotations, transform, resize_info,
+                            orig_w, orig_h, new_w, new_h) -> list:
+        """Build the COCO annotation records of an image (IDs are filled in by the caller)."""
+        records = []
+        
+        # Get cutout regions (if any)
+        cutout_regions = []
+        if transform and "cutout" in transform:
+            cutout_regions = transform["cutout"].get("regions", [])
+        
+        # Add BBoxes (collect final boxes, then convert them to pixels at once)
+        bbox_class_ids = []
+        bbox_coords = []
+        for bbox in annotations.bboxes:
+            coords = (bbox.x_center, bbox.y_center, bbox.width, bbox.height)
             
-            # Get cutout regions (if any)
-            cutout_regions = []
-            if transform and "cutout" in transform:
-                cutout_regions = transform["cutout"].get("regions", [])
+            # Cutout check (skip if covered 90%+)
+            if cutout_regions:
+                if self.augmentor.is_bbox_covered_by_cutout(coords, cutout_regions, orig_w, orig_h, 0.9):
+                    continue
             
-            # Annotation ID (based on current annotation count)
-            ann_id = len(coco_data["annotations"]) + 1
+            if transform:
+                coords = self.augmentor.transform_bbox(coords, transform, orig_w, orig_h)
             
-            # Add BBoxes
-            for bbox in annotations.bboxes:
-                coords = (bbox.x_center, bbox.y_center, bbox.width, bbox.height)
-                
-                # Cutout check (skip if covered 90%+)
-                if cutout_regions:
-                    if self.augmentor.is_bbox_covered_by_cutout(coords, cutout_regions, orig_w, orig_h, 0.9):
-                        continue
-                
-                if transform:
-                    coords = self.augmentor.transform_bbox(coords, transform, orig_w, orig_h)
-                
-                # Resize and Duplicate check
-                if resize_info:
-                    final_bboxes = self.augmentor.get_resize_duplicates_bbox(
-                        coords, resize_info, orig_w, orig_h, new_w, new_h)
-                else:
-                    final_bboxes = [coords]
-                
-                for final_bbox in final_bboxes:
-                    x_c, y_c, w, h = final_bbox
-                    # YOLO format from COCO format (x, y, width, height - top-left corner)
-                    x = (x_c - w/2) * new_w
-                    y = (y_c - h/2) * new_h
-                    width = w * new_w
-                    height = h * new_h
-                    
-                    coco_data["annotations"].append({
-                        "id": ann_id,
-                        "image_id": image_id,
-                        "category_id": bbox.class_id + 1,  # COCO categories start from 1
-                        "bbox": [round(x, 2), round(y, 2), round(width, 2), round(height, 2)],
-                        "area": round(width * height, 2),
-                        "segmentation": [],  # Empty segmentation for BBox
-                        "iscrowd": 0
-                    })
-                    ann_id += 1
+            # Resize and Duplicate check
+            if resize_info:
+                final_bboxes = self.augmentor.get_resize_duplicates_bbox(
+                    coords, resize_info, orig_w, orig_h, new_w, new_h)
+            else:
+                final_bboxes = [coords]
+            
+            for final_bbox in final_bboxes:
+                bbox_class_ids.append(bbox.class_id)
+                bbox_coords.append(final_bbox)
+        
+        if bbox_coords:
+            bb = np.asarray(bbox_coords, dtype=np.float64)
+            scale = np.array([new_w, new_h], dtype=np.float64)
+            # YOLO format to COCO format (x, y, width, height - top-left corner)
+            wh = bb[:, 2:] * scale
+            xy = bb[:, :2] * scale - wh / 2
+            areas = np.round(wh[:, 0] * wh[:, 1], 2).tolist()
+            boxes = np.round(np.hstack([xy, wh]), 2).tolist()
+            
+            for class_id, box, area in zip(bbox_class_ids, boxes, areas):
+                records.append({
+                    "id": 0,  # Assigned by _add_coco_annotation
+                    "image_id": 0,
+                    "category_id": class_id + 1,  # COCO categories start from 1
+                    "bbox": box,
+                    "area": area,
+                    "segmentation": [],  # Empty segmentation for BBox
+                    "iscrowd": 0
+                })
+        
+        # Add Polygons (as segmentation)
+        for polygon in annotations.polygons:
+            if not polygon.is_valid:
+                continue
             
-            # Add Polygons (as segmentation)
-            for polygon in annotations.polygons:
-                if len(polygon.points) < 3:
+            points = polygon.points
+            
+            # Cutout clipping: Remove cutout regions from Polygon
+            if cutout_regions:
+                clipped_polygons = self.augmentor.apply_cutout_to_polygon(
+                    points, cutout_regions, orig_w, orig_h
+                )
+            else:
+                clipped_polygons = [points]
+            
+            # Add separate annotation for each clipped polygon
+            for clipped_points in clipped_polygons:
+                if len(clipped_points) < 3:
                     continue
                 
-                points = polygon.points
+                final_points_list = [clipped_points]
                 
-                # Cutout clipping: Remove cutout regions from Polygon
-                if cutout_regions:
-                    clipped_polygons = self.augmentor.apply_cutout_to_polygon(
-                        points, cutout_regions, orig_w, orig_h
+                if transform:
+                    # Apply transform (keep the array when it feeds the resize step)
+                    new_points = self.augmentor.transform_polygon(
+                        clipped_points, transform, orig_w, orig_h, as_array=bool(resize_info)
                     )
-                else:
-                    clipped_polygons = [points]
+                    final_points_list = [new_points]
                 
-                # Add separate annotation for each clipped polygon
-                for clipped_points in clipped_polygons:
-                    if len(clipped_points) < 3:
-                        continue
-                    
-                    final_points_list = [clipped_points]
-                    
-                    if transform:
-                        # Apply transform
-                        new_points = self.augmentor.transform_polygon(clipped_points, transform, orig_w, orig_h)
-                        final_points_list = [new_points]
-                    
-                    # Get resize and duplicates
-                    processed_polygons = []
-                    for pts in final_points_list:
-                        if resize_info:
-                            dups = self.augmentor.get_resize_duplicates_polygon(
-                                pts, resize_info, orig_w, orig_h, new_w, new_h
-                            )
-                            processed_polygons.extend(dups)
-                        else:
-                            processed_polygons.append(pts)
-                            
-                    for poly_pts in processed_polygons:
-                        # Flattened coordinate list for segmentation [x1, y1, x2, y2, ...]
-                        seg_points = []
-                        min_x = float('inf')
-                        min_y = float('inf')
-                        max_x = float('-inf')
-                        max_y = float('-inf')
+                # Get resize and duplicates
+                processed_polygons = []
+                for pts in final_points_list:
+                    if resize_info:
+                        dups = self.augmentor.get_resize_duplicates_polygon(
+                            pts, resize_info, orig_w, orig_h, new_w, new_h
+                        )
+                        processed_polygons.extend(dups)
+                    else:
+                        processed_polygons.append(pts)
                         
-                        for px, py in poly_pts:
-                            px_abs = px * new_w
-                            py_abs = py * new_h
-                            
-                            seg_points.extend([round(px_abs, 2), round(py_abs, 2)])
-                            min_x = min(min_x, px_abs)
-                            min_y = min(min_y, py_abs)
-                            max_x = max(max_x, px_abs)
-                            max_y = max(max_y, py_abs)
+                for poly_pts in processed_polygons:
+                    pts = np.asarray(poly_pts, dtype=np.float64) * (new_w, new_h)
+                    
+                    # Flattened coordinate list for segmentation [x1, y1, x2, y2, ...]
+                    seg_points = np.round(pts, 2).ravel().tolist()
                     
                     # Calculate bounding box (from polygon)
-                    bbox_x = min_x
-                    bbox_y = min_y
-                    bbox_w = max_x - min_x
-                    bbox_h = max_y - min_y
+                    mins = pts.min(axis=0)
+                    sizes = pts.max(axis=0) - mins
                     
                     # Calculate area (shoelace formula)
-                    area = 0.0
-                    n = len(poly_pts)
-                    for i in range(n):
-                        j = (i + 1) % n
-                        x1, y1 = poly_pts[i]
-                        x2, y2 = poly_pts[j]
-                        area += (x1 * new_w) * (y2 * new_h)
-                        area -= (x2 * new_w) * (y1 * new_h)
-                    area = abs(area) / 2.0
+                    x, y = pts[:, 0], pts[:, 1]
+                    area = abs(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) / 2.0
                     
-                    coco_data["annotations"].append({
-                        "id": ann_id,
-                        "image_id": image_id,
+                    records.append({
+                        "id": 0,  # Assigned by _add_coco_annotation
+                        "image_id": 0,
                         "category_id": polygon.class_id + 1,  # COCO categories start from 1
-                        "bbox": [round(bbox_x, 2), round(bbox_y, 2), round(bbox_w, 2), round(bbox_h, 2)],
-                        "area": round(area, 2),
+                        "bbox": np.round(np.concatenate([mins, sizes]), 2).tolist(),
+                        "area": round(float(area), 2),
                         "segmentation": [seg_points],  # Polygon points
                         "iscrowd": 0
                     })
-                    ann_id += 1
+        
+        return records
     
     def _save_coco_json(self, output_dir: Path, splits: dict):
-        """Save COCO JSON files."""
-        import json
-        
+        """Save COCO JSON files (assembled from the spooled images/annotations)."""
         for split_name, coco_data in self._coco_data.items():
             if split_name:
                 json_path = output_dir / split_name / "annotations.json"
             else:
                 json_path = output_dir / "annotations.json"
             
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(coco_data, f, indent=2, ensure_ascii=False)
+            with coco_data["images"] as images_file, \
+                    coco_data["annotations"] as annotations_file, \
+                    open(json_path, "wb") as f:
+                f.write(b'{"images":[')
+                images_file.seek(0)
+                shutil.copyfileobj(images_file, f)
+                f.write(b'],"annotations":[')
+                annotations_file.seek(0)
+                shutil.copyfileobj(annotations_file, f)
+                f.write(b'],"categories":')
+                f.write(dumps_json(coco_data["categories"]))
+                f.write(b"}")
     
     def _save_transformed_labels(self, annotations, transform, resize_info,
                                    output_path, orig_w, orig_h, new_w, new_h):
@@ -523,55 +551,44 @@ class ExportWorkerV2(QThread):
                 x_c, y_c, w, h = final_bbox
                 lines.append(f"{bbox.class_id} {x_c:.6f} {y_c:.6f} {w:.6f} {h:.6f}")
         
+        # Collect polygons (after cutout clipping) so they can be transformed in one batch
+        polygon_class_ids = []
+        polygon_points = []
         for polygon in annotations.polygons:
-            if len(polygon.points) >= 3:
+            if polygon.is_valid:
                 points = polygon.points
                 
                 # Cutout clipping: Remove cutout regions from Polygon
                 if cutout_regions:
+                    # Clipping result can be multiple polygons
                     clipped_polygons = self.augmentor.apply_cutout_to_polygon(
                         points, cutout_regions, orig_w, orig_h
                     )
-                    
-                    # Clipping result can be multiple polygons
-                    for clipped_points in clipped_polygons:
-                        if len(clipped_points) >= 3:
-                            final_points_list = [clipped_points]
-                            if transform:
-                                final_points_list = [self.augmentor.transform_polygon(clipped_points, transform, orig_w, orig_h)]
-                            
-                            processed_polygons = []
-                            for pts in final_points_list:
-                                if resize_info:
-                                    dups = self.augmentor.get_resize_duplicates_polygon(
-                                        pts, resize_info, orig_w, orig_h, new_w, new_h
-                                    )
-                                    processed_polygons.extend(dups)
-                                else:
-                                    processed_polygons.append(pts)
-                            
-                            for pts in processed_polygons:
-                                points_str = " ".join(f"{x:.6f} {y:.6f}" for x, y in pts)
-                                lines.append(f"{polygon.class_id} {points_str}")
                 else:
-                    # Process normally if no cutout
-                    points_list = [points]
-                    if transform:
-                        points_list = [self.augmentor.transform_polygon(points, transform, orig_w, orig_h)]
-                    
-                    processed_polygons = []
-                    for pts in points_list:
-                         if resize_info:
-                             dups = self.augmentor.get_resize_duplicates_polygon(
-                                 pts, resize_info, orig_w, orig_h, new_w, new_h
-                             )
-                             processed_polygons.extend(dups)
-                         else:
-                             processed_polygons.append(pts)
-
-                    for pts in processed_polygons:
-                        points_str = " ".join(f"{x:.6f} {y:.6f}" for x, y in pts)
-                        lines.append(f"{polygon.class_id} {points_str}")
+                    clipped_polygons = [points]
+                
+                for clipped_points in clipped_polygons:
+                    if len(clipped_points) >= 3:
+                        polygon_class_ids.append(polygon.class_id)
+                        polygon_points.append(clipped_points)
+        
+        if transform:
+            polygon_points = self.augmentor.transform_polygons(polygon_points, transform, orig_w, orig_h)
+        
+        for class_id, pts in zip(polygon_class_ids, polygon_points):
+            if resize_info:
+                processed_polygons = self.augmentor.get_resize_duplicates_polygon(
+                    pts, resize_info, orig_w, orig_h, new_w, new_h
+                )
+            else:
+                processed_polygons = [pts]
+            
+            for pts in processed_polygons:
+                points_str = " ".join(f"{x:.6f} {y:.6f}" for x, y in pts)
+                lines.append(f"{class_id} {points_str}")
+        
+        if not lines and self.skip_empty_labels:
+            return  # No bboxes or valid polygons left: no label file
         
         with open(output_path, "w", encoding="utf-8") as f:
             f.write("\n".join(lines))
@@ -1318,6 +1335,12 @@ class ExportWizard(QDialog):
         self.custom_group.setVisible(False)
         layout.addWidget(self.custom_group)
         
+        self.skip_empty_labels = QCheckBox(self.tr("Only write non-empty label files"))
+        self.skip_empty_labels.setToolTip(
+            self.tr("Unlabeled images get no .txt file instead of an empty one")
+        )
+        layout.addWidget(self.skip_empty_labels)
+        
         output_group = QGroupBox(self.tr("Output Folder"))
         output_layout = QHBoxLayout(output_group)
         
@@ -1387,6 +1410,7 @@ class ExportWizard(QDialog):
         self.resize_mode.currentIndexChanged.connect(lambda: self._on_slider_changed('resize'))
         
         self.format_btn_group.buttonClicked.connect(self._on_format_changed)
+        self.custom_type.currentIndexChanged.connect(lambda: self._on_format_changed(None))
         self.browse_btn.clicked.connect(self._browse_output)
     
     def _go_back(self):
@@ -1552,6 +1576,11 @@ class ExportWizard(QDialog):
     
     def _on_format_changed(self, btn):
         self.custom_group.setVisible(self.custom_radio.isChecked())
+        # Only the .txt label formats write per-image label files
+        self.skip_empty_labels.setVisible(
+            self.yolo_radio.isChecked()
+            or (self.custom_radio.isChecked() and self.custom_type.currentText() == "TXT")
+        )
     
     def _browse_output(self):
         folder = QFileDialog.getExistingDirectory(
@@ -1707,7 +1736,9 @@ class ExportWizard(QDialog):
     def _create_exporter(self):
         if self.yolo_radio.isChecked():
             version = self.yolo_version.currentText().replace("YOLO", "")
-            return YOLOExporter(self._class_manager, version)
+            return YOLOExporter(
+                self._class_manager, version, skip_empty=self.skip_empty_labels.isChecked()
+            )
         elif self.coco_radio.isChecked():
             return COCOExporter(self._class_manager)
         elif self.voc_radio.isChecked():
@@ -1716,7 +1747,10 @@ class ExportWizard(QDialog):
             return YOLOExporter(self._class_manager, "v8")
         elif self.custom_radio.isChecked():
             if self.custom_type.currentText() == "TXT":
-                return CustomTXTExporter(self._class_manager, self.format_string.text())
+                return CustomTXTExporter(
+                    self._class_manager, self.format_string.text(),
+                    skip_empty=self.skip_empty_labels.isChecked()
+                )
             else:
                 return CustomJSONExporter(self._class_manager, {})
         return None
@@ -1759,7 +1793,8 @@ class ExportWizard(QDialog):
         
         self._worker = ExportWorkerV2(
             exporter, annotations_dict, Path(output), image_files,
-            self._get_augmentation_config(), self._get_split_config(), export_format
+            self._get_augmentation_config(), self._get_split_config(), export_format,
+            skip_empty_labels=self.skip_empty_labels.isChecked() and not self.skip_empty_labels.isHidden()
         )
         self._worker.progress.connect(self._on_progress)
         self._worker.finished.connect(self._on_export_finished)